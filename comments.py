@@ -4,6 +4,8 @@ LinkedIn Comment Deleter
 Automatically deletes your LinkedIn comments from your recent activity (comments) page.
 """
 
+import json
+import os
 import time
 import sys
 from selenium import webdriver
@@ -11,32 +13,269 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 import logging
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Persistent Chrome profile, so you only need to log in on the first run
+DEFAULT_PROFILE_DIR = os.path.join(os.path.expanduser("~"), ".linkedin-reset", "chrome-profile")
+
+# Resources the script never needs, blocked through CDP
+BLOCKED_URL_PATTERNS = ("*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.mp4", "*.woff*", "*.svg")
+
+# Selector chains, in priority order
+COMMENT_SELECTORS = (
+    "li.comments-comments-list__comment-item",
+    "article.comments-comment-item",
+    "div.comments-comment-item",
+    "div.update-components-comment",
+    "[data-test-id*='comment']",
+    "[data-id*='comment']"
+)
+COMMENT_CONTAINER_SELECTOR = "main div.scaffold-finite-scroll__content"
+COMMENT_MENU_SELECTORS = (
+    "button[aria-label*='Open options'][aria-label*='comment']",
+    "button[aria-label*='options'][aria-label*='comment']",
+    "button:has(svg[data-test-icon='overflow-web-ios-small'])",
+    "button.comment-options-dropdown__dropdown-trigger",
+    ".comment-options-dropdown__trigger, .comment-options-dropdown__trigger-icon"
+)
+MENU_ITEM_SELECTOR = ".artdeco-dropdown__content button, [role='menu'] button, .feed-shared-control-menu__content button"
+DELETE_OPTION_SELECTORS = (
+    ".artdeco-dropdown__content button[data-control-name='delete_comment']",
+    ".artdeco-dropdown__content button[data-control-name='delete']",
+    "[role='menu'] button[data-control-name='delete_comment']",
+    "[role='menu'] button[data-control-name='delete']"
+)
+DELETE_OPTION_TEXT_CANDIDATES = (
+    ".artdeco-dropdown__content button",
+    "[role='menu'] button",
+    "button",
+    "a, div[role='button']"
+)
+CONFIRM_BUTTON_CSS = "button.feed-components-shared-decision-modal__confirm-button"
+CONFIRM_BUTTON_XPATH = "//div[@role='dialog']//button[contains(@class, 'artdeco-button--primary') and (contains(., 'Delete') or contains(., 'Confirm') or contains(., 'Yes'))]"
+NETWORK_ERROR_TEXTS = (
+    "Error with your network",
+    "Something went wrong",
+    "Please try again",
+    "Network error",
+    "Connection error"
+)
+NETWORK_ERROR_XPATH = "//*[" + " or ".join(f"contains(text(), '{text}')" for text in NETWORK_ERROR_TEXTS) + "]"
+NETWORK_ERROR_CSS = ".feed-shared-error-message, [data-test-id*='error'], .error-message"
+
+# Shared visibility helper, close to is_displayed(): the element needs a non-empty box and
+# must not be hidden through visibility or opacity
+VISIBLE_JS = """
+const visible = el => {
+    if (!el) return false;
+    const r = el.getBoundingClientRect();
+    if (r.width === 0 || r.height === 0) return false;
+    const style = getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.opacity !== '0';
+};
+"""
+
+# Runs a whole selector fallback chain in the browser: returns [element, selector] for the
+# first rendered element matching the CSS selectors (in priority order) under the root, then
+# falls back to rendered candidates whose text or aria-label contains the given text
+# (selector is null for those).
+FIND_VISIBLE_JS = VISIBLE_JS + """
+const [root, selectors, text, textCandidates] = arguments;
+const scope = root || document;
+for (const sel of selectors) {
+    for (const el of scope.querySelectorAll(sel)) {
+        if (visible(el)) return [el, sel];
+    }
+}
+if (text) {
+    for (const sel of textCandidates) {
+        for (const el of scope.querySelectorAll(sel)) {
+            const label = el.getAttribute('aria-label') || '';
+            if (visible(el) && (el.textContent.includes(text) || label.includes(text))) return [el, null];
+        }
+    }
+}
+return null;
+"""
+
+# Scrolls an element to the centre and clicks it in the same browser tick
+SCROLL_CLICK_JS = "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();"
+
+# True when any element matched by the XPath or the CSS selector is rendered
+ANY_VISIBLE_JS = VISIBLE_JS + """
+const [xpath, css] = arguments;
+const hits = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+for (let i = 0; i < hits.snapshotLength; i++) {
+    if (visible(hits.snapshotItem(i))) return true;
+}
+return Array.from(document.querySelectorAll(css)).some(visible);
+"""
+
+# Installed on every new document: flags the page as soon as a node that looks like
+# a LinkedIn network error is inserted, so the common no-error check is one tiny script.
+NETWORK_ERROR_OBSERVER_JS = """
+(() => {
+    window.__linNetErr = false;
+    const css = %s;
+    const texts = %s;
+    new MutationObserver(mutations => {
+        for (const m of mutations) {
+            for (const n of m.addedNodes) {
+                const el = n.nodeType === 1 ? n : n.parentElement;
+                if (!el) continue;
+                const text = n.textContent || '';
+                if (el.matches(css) || el.querySelector(css) || texts.some(t => text.includes(t))) {
+                    window.__linNetErr = true;
+                    return;
+                }
+            }
+        }
+    }).observe(document, {childList: true, subtree: true});
+})();
+""" % (json.dumps(NETWORK_ERROR_CSS), json.dumps(NETWORK_ERROR_TEXTS))
+
+# Only runs the full visibility check once the observer has flagged the page
+NETWORK_ERROR_CHECK_JS = "if (!window.__linNetErr) return false;\n" + ANY_VISIBLE_JS
+
+# Maps comment elements to a stable key (data-id / data-urn on the element or inside it)
+COMMENT_IDS_JS = """
+return arguments[0].map(el => {
+    const keyed = el.matches('[data-id], [data-urn]') ? el : el.querySelector('[data-id], [data-urn]');
+    return keyed ? (keyed.getAttribute('data-id') || keyed.getAttribute('data-urn')) : null;
+});
+"""
+
+# Runs the whole open-menu / delete / confirm sequence for one comment inside the
+# browser and reports [status, menu selector, delete selector]: the status is 'deleted',
+# 'restricted', 'no_confirm', 'no_menu' or 'no_menu_items', and the selectors are the ones
+# that matched in each chain (null if none did). Each stage polls for the next element
+# instead of sleeping.
+DELETE_COMMENT_JS = VISIBLE_JS + """
+const [comment, menuSelectors, menuItemSelector, deleteSelectors, deleteText, textCandidates, confirmCss, reply] = arguments;
+const matched = {menu: null, delete: null};
+const done = status => reply([status, matched.menu, matched.delete]);
+const first = (scope, sels, chain) => {
+    for (const sel of sels) {
+        for (const el of scope.querySelectorAll(sel)) {
+            if (visible(el)) {
+                if (chain) matched[chain] = sel;
+                return el;
+            }
+        }
+    }
+    return null;
+};
+const byText = sels => {
+    for (const sel of sels) {
+        for (const el of document.querySelectorAll(sel)) {
+            const label = el.getAttribute('aria-label') || '';
+            if (visible(el) && (el.textContent.includes(deleteText) || label.includes(deleteText))) return el;
+        }
+    }
+    return null;
+};
+const waitFor = (find, timeout) => new Promise(resolve => {
+    const start = Date.now();
+    const poll = () => {
+        const found = find();
+        if (found || Date.now() - start > timeout) resolve(found);
+        else setTimeout(poll, 50);
+    };
+    poll();
+});
+(async () => {
+    const menu = first(comment, menuSelectors, 'menu');
+    if (!menu) return done('no_menu');
+    menu.scrollIntoView({block: 'center'});
+    menu.click();
+    if (!await waitFor(() => first(document, [menuItemSelector]), 3000)) return done('no_menu_items');
+    const del = first(document, deleteSelectors, 'delete') || byText(textCandidates);
+    if (!del) return done('restricted');
+    del.scrollIntoView({block: 'center'});
+    del.click();
+    const confirm = await waitFor(() => first(document, [confirmCss]), 3000);
+    if (!confirm) return done('no_confirm');
+    confirm.click();
+    await waitFor(() => !first(document, [confirmCss]), 3000);
+    done('deleted');
+})().catch(e => done('error: ' + e.message));
+"""
+
+# Request types that count towards network idle; documents, scripts and media are left out
+TRACKED_REQUEST_TYPES = ("XHR", "Fetch")
+
+# Scrolls to the bottom until the page height has stopped changing for three polls
+# (or maxRounds growth rounds have happened) and reports the final height.
+SCROLL_UNTIL_STABLE_JS = """
+const [maxRounds, settleMs, done] = arguments;
+(async () => {
+    let last = -1, same = 0, rounds = 0;
+    while (rounds < maxRounds) {
+        window.scrollTo(0, document.body.scrollHeight);
+        await new Promise(resolve => setTimeout(resolve, settleMs));
+        const height = document.body.scrollHeight;
+        if (height === last) {
+            if (++same >= 3) break;
+        } else {
+            same = 0;
+            last = height;
+            rounds++;
+        }
+    }
+    done(document.body.scrollHeight);
+})();
+"""
+
 class LinkedInCommentDeleter:
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, profile_dir: str | None = DEFAULT_PROFILE_DIR):
         self.driver = None
         self.headless = headless
+        self.profile_dir = profile_dir
+        self._pending_requests: dict[str, float] = {}  # In-flight XHR/fetch request ids -> start time
+        # Last selector that matched per chain ('menu', 'delete'), tried first on the next lookup
+        self._winning_selectors: dict[str, str] = {}
+        self._selector_misses: dict[str, int] = {}
         self.setup_driver()
     
     def setup_driver(self) -> None:
         chrome_options = Options()
         if self.headless:
-            chrome_options.add_argument("--headless")
+            chrome_options.add_argument("--headless=new")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-extensions")
+        # Keep timers and rendering running at full speed while the window is in the background
+        chrome_options.add_argument("--disable-background-timer-throttling")
+        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+        chrome_options.add_argument("--disable-renderer-backgrounding")
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
+        if self.profile_dir:
+            # Reuse the same Chrome profile across runs so the LinkedIn login persists
+            chrome_options.add_argument(f"--user-data-dir={self.profile_dir}")
+            chrome_options.add_argument("--profile-directory=Default")
+        # Network events are read from the performance log, which the page itself can't observe
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        chrome_options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
         chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
         try:
             self.driver = webdriver.Chrome(options=chrome_options)
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": NETWORK_ERROR_OBSERVER_JS})
+            # Media and fonts are never inspected; skipping them keeps scrolls and refreshes light
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(BLOCKED_URL_PATTERNS)})
             logger.info("Chrome WebDriver initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Chrome WebDriver: {e}")
@@ -51,174 +290,197 @@ class LinkedInCommentDeleter:
         except TimeoutException:
             logger.warning("Page load timeout, continuing anyway...")
     
+    def count_pending_requests(self, max_age: float = 10) -> int:
+        """Update the in-flight XHR/fetch requests from the CDP Network events in the performance log.
+        Returns: how many are pending, ignoring ones older than max_age seconds (long-polls).
+        """
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            params = message.get("params", {})
+            if message.get("method") == "Network.requestWillBeSent":
+                if params.get("type") in TRACKED_REQUEST_TYPES:
+                    self._pending_requests[params["requestId"]] = entry["timestamp"] / 1000
+            elif message.get("method") in ("Network.loadingFinished", "Network.loadingFailed"):
+                self._pending_requests.pop(params.get("requestId"), None)
+        cutoff = time.time() - max_age
+        self._pending_requests = {rid: started for rid, started in self._pending_requests.items() if started >= cutoff}
+        return len(self._pending_requests)
+
+    def wait_for_network_idle(self, timeout: float = 5, idle_ms: int = 250) -> None:
+        """Wait until no fetch/XHR request has been in flight for idle_ms, capped at timeout.
+        Requests older than 10s are treated as long-polls and ignored.
+        """
+        deadline = time.monotonic() + timeout
+        idle_since = None
+        while time.monotonic() < deadline:
+            try:
+                busy = self.count_pending_requests(max_age=10)
+            except Exception:
+                busy = 0
+            now = time.monotonic()
+            if busy:
+                idle_since = None
+            elif idle_since is None:
+                idle_since = now
+            elif now - idle_since >= idle_ms / 1000:
+                return
+            time.sleep(0.05)
+    
     def check_for_network_error(self) -> bool:
         try:
-            error_selectors = [
-                "//*[contains(text(), 'Error with your network')]",
-                "//*[contains(text(), 'Something went wrong')]",
-                "//*[contains(text(), 'Please try again')]",
-                "//*[contains(text(), 'Network error')]",
-                "//*[contains(text(), 'Connection error')]",
-                ".feed-shared-error-message",
-                "[data-test-id*='error']",
-                ".error-message"
-            ]
-            for selector in error_selectors:
-                try:
-                    if selector.startswith("//"):
-                        error_element = self.driver.find_element(By.XPATH, selector)
-                    else:
-                        error_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if error_element.is_displayed():
-                        logger.warning("Network error detected, waiting and retrying...")
-                        time.sleep(5)
-                        self.driver.refresh()
-                        time.sleep(3)
-                        self.wait_for_page_load()
-                        logger.info("Page refreshed after network error")
-                        return True
-                except NoSuchElementException:
-                    continue
+            if self.driver.execute_script(NETWORK_ERROR_CHECK_JS, NETWORK_ERROR_XPATH, NETWORK_ERROR_CSS):
+                logger.warning("Network error detected, waiting and retrying...")
+                time.sleep(5)
+                self.driver.refresh()
+                self.wait_for_page_load()
+                self.wait_for_network_idle(timeout=3)
+                logger.info("Page refreshed after network error")
+                return True
             return False
         except Exception as e:
             logger.warning(f"Error checking for network error: {e}")
             return False
 
-    def delete_comment(self, comment_element) -> bool | str:
-        """Delete a single comment via its overflow menu.
+    def selector_chain(self, chain: str, selectors: tuple[str, ...]) -> tuple[str, ...]:
+        """Return the selector chain with the selector that last matched for it moved to the front."""
+        winner = self._winning_selectors.get(chain)
+        if not winner:
+            return selectors
+        return (winner,) + tuple(sel for sel in selectors if sel != winner)
+
+    def record_selector(self, chain: str, selector: str | None) -> None:
+        """Remember the selector that matched for a chain. The current winner is replaced after
+        3 consecutive lookups won by a different selector; lookups with no match don't count.
+        """
+        if not selector:
+            return
+        winner = self._winning_selectors.get(chain)
+        if selector == winner:
+            self._selector_misses[chain] = 0
+        elif not winner or self._selector_misses.get(chain, 0) >= 2:
+            self._winning_selectors[chain] = selector
+            self._selector_misses[chain] = 0
+        else:
+            self._selector_misses[chain] = self._selector_misses.get(chain, 0) + 1
+
+    def find_visible(self, root, selectors: tuple[str, ...], text: str | None = None, text_candidates: tuple[str, ...] = (), chain: str | None = None):
+        """Locate the first rendered match for a selector chain with a single WebDriver call.
+        When a chain name is given, its last winning selector is tried first and the match is recorded.
+        Returns: the WebElement, or None if nothing matched.
+        """
+        if chain:
+            selectors = self.selector_chain(chain, selectors)
+        result = self.driver.execute_script(FIND_VISIBLE_JS, root, selectors, text, text_candidates)
+        if not result:
+            return None
+        element, selector = result
+        if chain:
+            self.record_selector(chain, selector)
+        return element
+
+    def delete_comment(self, comment_element, comment_id: str | None = None) -> bool | str:
+        """Delete a single comment via its overflow menu, running the click sequence in the browser.
+        A stale element is re-located once by comment_id; falls back to delete_comment_stepwise
+        if the script itself cannot run.
+        Returns: True if deleted, False if failed, 'restricted' if no delete option,
+        'stale' if the comment is no longer on the page.
+        """
+        try:
+            status, menu_selector, delete_selector = self.driver.execute_async_script(
+                DELETE_COMMENT_JS, comment_element, self.selector_chain("menu", COMMENT_MENU_SELECTORS),
+                MENU_ITEM_SELECTOR, self.selector_chain("delete", DELETE_OPTION_SELECTORS), "Delete",
+                DELETE_OPTION_TEXT_CANDIDATES, CONFIRM_BUTTON_CSS
+            )
+        except StaleElementReferenceException:
+            fresh = None
+            if comment_id:
+                fresh = next(iter(self.driver.find_elements(By.CSS_SELECTOR, f"[data-id='{comment_id}'], [data-urn='{comment_id}']")), None)
+            if not fresh:
+                logger.info("Comment element went stale and is no longer on the page")
+                return 'stale'
+            logger.info("Comment element went stale, retrying with re-located element")
+            return self.delete_comment(fresh)
+        except Exception as e:
+            logger.warning(f"In-browser delete failed: {e}, falling back to step-by-step delete")
+            return self.delete_comment_stepwise(comment_element)
+        self.record_selector("menu", menu_selector)
+        self.record_selector("delete", delete_selector)
+        if status == 'deleted':
+            logger.info("Comment deleted")
+            return True
+        if status == 'no_confirm':
+            logger.warning("No confirmation modal found; assuming deletion proceeded")
+            return True
+        if status == 'restricted':
+            logger.info("No delete option found for this comment (likely not your comment)")
+            try:
+                ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
+            except Exception:
+                pass
+            return 'restricted'
+        logger.error(f"Failed to delete comment: {status}")
+        return False
+
+    def delete_comment_stepwise(self, comment_element) -> bool | str:
+        """Delete a single comment via its overflow menu, one WebDriver command per step.
         Returns: True if deleted, False if failed, 'restricted' if no delete option.
         """
         try:
-            menu_button = None
-            comment_menu_attempts = [
-                ("css", "button[aria-label*='Open options'][aria-label*='comment']"),
-                ("css", "button[aria-label*='options'][aria-label*='comment']"),
-                ("xpath", ".//button[contains(@aria-label, 'options') and contains(@aria-label, 'comment')]") ,
-                ("xpath", ".//button[.//svg[@data-test-icon='overflow-web-ios-small']]"),
-                ("css", "button.comment-options-dropdown__dropdown-trigger"),
-                ("css", ".comment-options-dropdown__trigger, .comment-options-dropdown__trigger-icon")
-            ]
-            for strategy, selector in comment_menu_attempts:
-                try:
-                    if strategy == "css":
-                        el = comment_element.find_element(By.CSS_SELECTOR, selector)
-                    else:
-                        el = comment_element.find_element(By.XPATH, selector)
-                    if el and el.is_displayed():
-                        menu_button = el
-                        logger.info(f"Found comment menu via {strategy}: {selector}")
-                        break
-                except NoSuchElementException:
-                    continue
+            menu_button = self.find_visible(comment_element, COMMENT_MENU_SELECTORS, chain="menu")
             if not menu_button:
                 logger.error("Could not find overflow menu for comment")
                 return False
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", menu_button)
-            time.sleep(0.5)
-            try:
-                menu_button.click()
-            except Exception:
-                self.driver.execute_script("arguments[0].click();", menu_button)
-            # Wait for menu to appear with more specific selectors
+            self.driver.execute_script(SCROLL_CLICK_JS, menu_button)
+            # Wait for the menu items to render, not just the menu container
             try:
                 WebDriverWait(self.driver, 3).until(
-                    lambda d: len(d.find_elements(By.CSS_SELECTOR, ".artdeco-dropdown__content, [role='menu'], .feed-shared-control-menu__content")) > 0
+                    lambda d: len(d.find_elements(By.CSS_SELECTOR, MENU_ITEM_SELECTOR)) > 0
                 )
                 logger.info("Comment options menu appeared")
             except TimeoutException:
                 logger.warning("Comment options menu did not appear in time")
             
-            # Wait a bit more for menu to fully render
-            time.sleep(1)
-            
-            # Try to find delete button with more comprehensive selectors
-            delete_button = None
-            delete_option_attempts = [
-                # Try specific LinkedIn comment delete selectors
-                ("css", ".artdeco-dropdown__content button[data-control-name='delete_comment']"),
-                ("css", ".artdeco-dropdown__content button[data-control-name='delete']"),
-                ("css", "[role='menu'] button[data-control-name='delete_comment']"),
-                ("css", "[role='menu'] button[data-control-name='delete']"),
-                # Try text-based selectors
-                ("xpath", "//div[@class='artdeco-dropdown__content']//button[contains(., 'Delete')]"),
-                ("xpath", "//div[@role='menu']//button[contains(., 'Delete')]"),
-                ("xpath", "//button[contains(., 'Delete comment')]"),
-                ("xpath", "//button[contains(., 'Delete')]"),
-                # Try any button with delete in aria-label
-                ("xpath", "//button[contains(@aria-label, 'Delete')]"),
-                # Try any clickable element with delete text
-                ("xpath", "//*[contains(., 'Delete') and (self::button or self::a or self::div[@role='button'])]")
-            ]
-            
-            for strategy, selector in delete_option_attempts:
-                try:
-                    if strategy == "css":
-                        delete_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    else:
-                        delete_button = self.driver.find_element(By.XPATH, selector)
-                    
-                    if delete_button and delete_button.is_displayed():
-                        logger.info(f"Found delete option using {strategy}: {selector}")
-                        break
-                    else:
-                        delete_button = None
-                except NoSuchElementException:
-                    continue
+            # Try specific delete selectors first, then any rendered menu entry mentioning "Delete"
+            delete_button = self.find_visible(None, DELETE_OPTION_SELECTORS, "Delete", DELETE_OPTION_TEXT_CANDIDATES, chain="delete")
+            if delete_button:
+                logger.info("Found delete option in comment menu")
             
             if not delete_button:
                 logger.info("No delete option found for this comment (likely not your comment)")
-                # Close the menu by clicking elsewhere
+                # Close the menu with Escape, which the dropdown handles natively
                 try:
-                    self.driver.execute_script("document.activeElement && document.activeElement.blur();")
-                    # Click on a safe area to close menu
-                    self.driver.execute_script("document.body.click();")
+                    ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
                 except Exception:
                     pass
                 return 'restricted'
             
-            # Scroll delete button into view and wait
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", delete_button)
-            time.sleep(0.5)
-            
-            # Try to click delete button with better error handling
             try:
-                logger.info("Attempting to click delete button...")
-                delete_button.click()
+                self.driver.execute_script(SCROLL_CLICK_JS, delete_button)
                 logger.info("Successfully clicked delete button")
             except Exception as e:
-                logger.warning(f"Regular click failed: {e}, trying JavaScript click")
-                try:
-                    self.driver.execute_script("arguments[0].click();", delete_button)
-                    logger.info("Successfully clicked delete button with JavaScript")
-                except Exception as e2:
-                    logger.error(f"JavaScript click also failed: {e2}")
-                    return False
+                logger.error(f"Failed to click delete button: {e}")
+                return False
             
             # Wait for confirmation dialog to appear
-            time.sleep(0.3)
             try:
-                confirm_selectors = [
-                    ("css", "button.feed-components-shared-decision-modal__confirm-button.artdeco-button.artdeco-button--primary.artdeco-button--2"),
-                    ("xpath", "//div[@role='dialog']//button[contains(@class, 'artdeco-button--primary') and (contains(., 'Delete') or contains(., 'Confirm') or contains(., 'Yes'))]")
-                ]
                 confirm_button = None
-                for strategy, selector in confirm_selectors:
-                    try:
-                        if strategy == "css":
-                            confirm_button = WebDriverWait(self.driver, 1).until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
-                        else:
-                            confirm_button = WebDriverWait(self.driver, 1).until(EC.element_to_be_clickable((By.XPATH, selector)))
-                        break
-                    except TimeoutException:
-                        continue
+                try:
+                    confirm_button = WebDriverWait(self.driver, 3).until(EC.any_of(
+                        EC.element_to_be_clickable((By.CSS_SELECTOR, CONFIRM_BUTTON_CSS)),
+                        EC.element_to_be_clickable((By.XPATH, CONFIRM_BUTTON_XPATH))
+                    ))
+                except TimeoutException:
+                    pass
                 if confirm_button:
+                    self.driver.execute_script(SCROLL_CLICK_JS, confirm_button)
                     try:
-                        confirm_button.click()
-                    except Exception:
-                        self.driver.execute_script("arguments[0].click();", confirm_button)
+                        WebDriverWait(self.driver, 3).until(
+                            EC.invisibility_of_element_located((By.CSS_SELECTOR, CONFIRM_BUTTON_CSS))
+                        )
+                    except TimeoutException:
+                        logger.warning("Confirmation modal still visible after confirming")
                 else:
                     logger.warning("No confirmation modal found; assuming deletion proceeded")
-                time.sleep(1)
                 logger.info("Comment deleted")
                 return True
             except Exception as e:
@@ -228,41 +490,55 @@ class LinkedInCommentDeleter:
             logger.error(f"Failed to delete comment: {e}")
             return False
 
-    def initial_scroll_loading(self, scroll_rounds: int = 5, scroll_delay: int = 2) -> None:
-        logger.info(f"Performing initial scrolling to load more comments ({scroll_rounds} rounds)...")
-        for i in range(scroll_rounds):
-            logger.info(f"Initial scroll round {i+1}/{scroll_rounds}")
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(scroll_delay)
-            if self.check_for_network_error():
-                logger.info("Network error handled during initial scrolling...")
-            current_height = self.driver.execute_script("return document.body.scrollHeight")
-            logger.info(f"Page height after scroll {i+1}: {current_height}")
+    def find_comment_container(self):
+        """Return the feed's scroll container so comment scans stay inside it; falls back to the whole page."""
+        containers = self.driver.find_elements(By.CSS_SELECTOR, COMMENT_CONTAINER_SELECTOR)
+        return containers[0] if containers else self.driver
+
+    def discard_comment(self, comment_element) -> None:
+        """Remove a handled comment row from the DOM so later scans only walk unhandled rows."""
+        try:
+            self.driver.execute_script("if (arguments[0].isConnected) arguments[0].remove();", comment_element)
+        except Exception:
+            pass
+
+    def initial_scroll_loading(self, scroll_rounds: int = 5, settle_ms: int = 500) -> None:
+        logger.info(f"Performing initial scrolling to load more comments (up to {scroll_rounds} rounds)...")
+        # Worst case: every round grows the page after two unchanged polls, plus the final three
+        self.driver.set_script_timeout(max(30, (scroll_rounds * 3 + 3) * settle_ms / 1000 + 10))
+        height = self.driver.execute_async_script(SCROLL_UNTIL_STABLE_JS, scroll_rounds, settle_ms)
+        logger.info(f"Page height after initial scrolling: {height}")
+        if self.check_for_network_error():
+            logger.info("Network error handled during initial scrolling...")
         logger.info("Initial scrolling complete, starting comment processing...")
 
     def process_comments(self, max_comments: int | None = None, initial_scroll_rounds: int = 5) -> None:
         logger.info("Starting to process comments...")
         self.wait_for_page_load()
-        time.sleep(3)
+        self.wait_for_network_idle(timeout=3)
         self.initial_scroll_loading(scroll_rounds=initial_scroll_rounds)
         deleted_count = 0
         restricted_count = 0
         processed_count = 0
         consecutive_failures = 0
-        refresh_interval = 200  # Refresh page every 50 successful deletes
+        refresh_interval = 1000  # Handled rows are removed from the DOM; refresh only as a periodic fallback
+        preserved_id = None
+        handled_ids = set()  # Comments already preserved/deleted/attempted, keyed across rescans
+        container = None
         while True:
-            comment_selectors = [
-                "li.comments-comments-list__comment-item",
-                "article.comments-comment-item",
-                "div.comments-comment-item",
-                "div.update-components-comment",
-                "[data-test-id*='comment']",
-                "[data-id*='comment']"
-            ]
             comments = []
-            for selector in comment_selectors:
+            for selector in COMMENT_SELECTORS:
                 try:
-                    comments = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                    if container is None:
+                        container = self.find_comment_container()
+                    comments = container.find_elements(By.CSS_SELECTOR, selector)
+                    if comments:
+                        logger.info(f"Found {len(comments)} comments using selector: {selector}")
+                        break
+                except StaleElementReferenceException:
+                    # Container was replaced (e.g. after a refresh); re-find it and retry
+                    container = self.find_comment_container()
+                    comments = container.find_elements(By.CSS_SELECTOR, selector)
                     if comments:
                         logger.info(f"Found {len(comments)} comments using selector: {selector}")
                         break
@@ -271,18 +547,44 @@ class LinkedInCommentDeleter:
             if not comments:
                 logger.warning("No comments found on the page")
                 break
+            comment_ids = self.driver.execute_script(COMMENT_IDS_JS, comments)
+            if not any(comment_ids):
+                # Nothing here can be told apart after a refresh, so nothing can be deleted safely
+                logger.warning(f"None of the {len(comments)} comments found has a data-id/data-urn; "
+                               "LinkedIn's markup may have changed, stopping")
+                break
+            rescan = False  # Set when the fetched handles can no longer be trusted
             for i, comment in enumerate(comments):
+                comment_id = comment_ids[i]
+                if comment_id is None:
+                    # Without data-id/data-urn the comment can't be recognised after a refresh,
+                    # so it may be the preserved one; keep it rather than risk deleting it, and
+                    # drop the row so later passes only see comments that haven't been looked at
+                    if preserved_id is None:
+                        preserved_id = comment.id
+                    logger.warning(f"Keeping comment without a data-id/data-urn (page comment {i+1}/{len(comments)})")
+                    self.discard_comment(comment)
+                    continue
+                if comment_id in handled_ids:
+                    continue
                 if max_comments and processed_count >= max_comments:
                     logger.info(f"Reached maximum comments limit ({max_comments}), stopping processing")
                     return
                 processed_count += 1
+                handled_ids.add(comment_id)
                 try:
                     logger.info(f"Processing comment {processed_count} (page comment {i+1}/{len(comments)})")
+                    # A refresh leaves every fetched handle stale, so release this comment and rescan
                     if self.check_for_network_error():
-                        logger.info("Network error handled, continuing with comment processing...")
+                        logger.info("Network error handled, rescanning comments...")
+                        handled_ids.discard(comment_id)
+                        processed_count -= 1
+                        rescan = True
+                        break
                     
-                    # Skip the first comment (preserve it)
-                    if i == 0:
+                    # Preserve the very first comment seen; it stays in handled_ids on later rescans
+                    if preserved_id is None:
+                        preserved_id = comment_id
                         logger.info("Skipping first comment (preserved)")
                         continue
                     
@@ -290,8 +592,9 @@ class LinkedInCommentDeleter:
                     max_retries = 2
                     deleted = False
                     is_restricted = False
+                    is_stale = False
                     for retry in range(max_retries):
-                        result = self.delete_comment(comment)
+                        result = self.delete_comment(comment, comment_ids[i])
                         if result == True:
                             deleted_count += 1
                             logger.info(f"Successfully deleted comment {processed_count}")
@@ -302,16 +605,15 @@ class LinkedInCommentDeleter:
                             if deleted_count % refresh_interval == 0:
                                 logger.info(f"Refreshing page after {deleted_count} successful deletions to clear old posts...")
                                 self.driver.refresh()
-                                time.sleep(5)  # Wait for page to reload
                                 self.wait_for_page_load()
+                                self.wait_for_network_idle(timeout=5)
                                 
                                 # Perform initial scrolling after refresh to reload more content
                                 logger.info("Performing post-refresh scrolling to reload more comments...")
-                                self.initial_scroll_loading(scroll_rounds=3, scroll_delay=2)
+                                self.initial_scroll_loading(scroll_rounds=3)
                                 
                                 logger.info("Page refreshed and scrolled, continuing with fresh content...")
-                                break  # Break out of current page processing to start fresh
-                            
+                                rescan = True  # The comment loop stops after this deletion
                             break
                         elif result == 'restricted':
                             restricted_count += 1
@@ -319,12 +621,22 @@ class LinkedInCommentDeleter:
                             is_restricted = True
                             consecutive_failures = 0
                             break
+                        elif result == 'stale':
+                            # LinkedIn re-rendered the list; not a failure worth a refresh
+                            is_stale = True
+                            break
                         else:
                             if retry < max_retries - 1:
                                 logger.warning(f"Failed to delete comment {processed_count}, retrying... (attempt {retry + 1}/{max_retries})")
                                 time.sleep(2)
                             else:
                                 logger.warning(f"Failed to delete comment {processed_count} after {max_retries} attempts")
+                    if is_stale:
+                        # Release the comment so the rescan picks it up with a fresh handle
+                        handled_ids.discard(comment_id)
+                        processed_count -= 1
+                        rescan = True
+                        break
                     if is_restricted:
                         continue
                     if not deleted:
@@ -333,33 +645,44 @@ class LinkedInCommentDeleter:
                         if consecutive_failures >= 5:
                             logger.info("Too many consecutive failures, refreshing page to clear stale elements...")
                             self.driver.refresh()
-                            time.sleep(5)
                             self.wait_for_page_load()
+                            self.wait_for_network_idle(timeout=5)
                             logger.info("Performing post-refresh scrolling to reload more content...")
-                            self.initial_scroll_loading(scroll_rounds=3, scroll_delay=2)
+                            self.initial_scroll_loading(scroll_rounds=3)
                             consecutive_failures = 0
                             logger.info("Page refreshed and scrolled, continuing with fresh elements...")
+                            rescan = True
                             break
                         continue
+                    if rescan:
+                        break  # Refreshed after this deletion
                     time.sleep(2)
                     if self.check_for_network_error():
-                        logger.info("Network error handled after deletion...")
+                        logger.info("Network error handled after deletion, rescanning comments...")
+                        rescan = True
+                        break
                 except Exception as e:
                     logger.error(f"Error processing comment {processed_count}: {e}")
                     if self.check_for_network_error():
-                        logger.info("Network error handled after exception...")
+                        logger.info("Network error handled after exception, rescanning comments...")
+                        rescan = True
+                        break
                     continue
+                finally:
+                    self.discard_comment(comment)
+            if rescan:
+                continue
             if max_comments and processed_count >= max_comments:
                 logger.info(f"Reached maximum comments limit ({max_comments}), stopping processing")
                 break
             logger.info("Scrolling down to load more comments...")
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(3)
+            self.wait_for_network_idle(timeout=3)
             if self.check_for_network_error():
                 logger.info("Network error handled after scrolling...")
             current_height = self.driver.execute_script("return document.body.scrollHeight")
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            self.wait_for_network_idle(timeout=2)
             new_height = self.driver.execute_script("return document.body.scrollHeight")
             if current_height == new_height:
                 logger.info("Reached end of page, no more comments to load")
@@ -369,10 +692,12 @@ class LinkedInCommentDeleter:
     def run(self, url: str, max_comments: int | None = None, initial_scroll_rounds: int = 5) -> None:
         try:
             logger.info(f"Navigating to: {url}")
-            self.driver.get(url)
+            # Page.navigate returns once the navigation commits instead of blocking on the
+            # full load like driver.get; wait_for_page_load below gates on readyState.
+            self.driver.execute_cdp_cmd("Page.navigate", {"url": url})
             logger.info("Waiting for page to load...")
             self.wait_for_page_load()
-            time.sleep(3)
+            self.wait_for_network_idle(timeout=3)
             current_url = self.driver.current_url
             logger.info(f"Current URL after navigation: {current_url}")
             if "login" in current_url.lower() or "auth" in current_url.lower():
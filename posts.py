@@ -5,31 +5,250 @@ Automatically deletes LinkedIn posts from your recent activity page,
 while preserving posts made to community groups.
 """
 
+import json
 import time
 import sys
-from selenium import webdriver
+import random
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 import logging
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Logging is configured in __main__ so importing this module leaves the host's setup alone
 logger = logging.getLogger(__name__)
 
+# Common network error markers, joined so each check is a single query per selector type
+NETWORK_ERROR_CSS = ".feed-shared-error-message, [data-test-id*='error'], .error-message"
+NETWORK_ERROR_XPATH = (
+    "//*[contains(text(), 'Error with your network') or contains(text(), 'Something went wrong')"
+    " or contains(text(), 'Please try again') or contains(text(), 'Network error')"
+    " or contains(text(), 'Connection error')]"
+)
+
+# Selector chains for the post menu, in priority order
+MENU_SELECTORS = [
+    "button[aria-label*='More actions']",
+    "button[aria-label*='More']",
+    "button[data-test-id*='more']",
+    ".feed-shared-control-menu__trigger",
+    "button[class*='control-menu']",
+    ".feed-shared-control-menu button"
+]
+DELETE_BUTTON_SELECTORS = [".option-delete .feed-shared-control-menu__headline"]
+
+# Repost indicators in priority order: repost of a repost with thoughts (3rd button),
+# simple repost (4th button), then repost with my thoughts (5th button)
+REPOST_KEYWORDS = (
+    ("reposted with thoughts", "repost_of_repost"),
+    ("shared with thoughts", "repost_of_repost"),
+    ("reposted and added", "repost_of_repost"),
+    ("shared and added", "repost_of_repost"),
+    ("reposted with comment", "repost_of_repost"),
+    ("shared with comment", "repost_of_repost"),
+    ("reposted this", "simple_repost"),
+    ("shared this", "simple_repost"),
+    ("reposted with my thoughts", "repost_with_thoughts"),
+    ("shared with my thoughts", "repost_with_thoughts"),
+    ("reposted and added my thoughts", "repost_with_thoughts"),
+    ("shared and added my thoughts", "repost_with_thoughts")
+)
+REPOST_BUTTONS = {'repost_of_repost': '3rd', 'simple_repost': '4th', 'repost_with_thoughts': '5th'}
+
+# Runs a selector chain in the browser and returns the first element with a non-empty
+# box, falling back to rendered buttons whose text contains arguments[2]
+FIND_VISIBLE_JS = """
+const [root, selectors, text] = arguments;
+const scope = root || document;
+const visible = el => { const r = el.getBoundingClientRect(); return r.width > 0 && r.height > 0; };
+for (const sel of selectors) {
+    for (const el of scope.querySelectorAll(sel)) {
+        if (visible(el)) return el;
+    }
+}
+if (text) {
+    for (const el of scope.querySelectorAll('button')) {
+        if (visible(el) && el.textContent.includes(text)) return el;
+    }
+}
+return null;
+"""
+
+# Element wrapping a post's menu button and the dropdown it opens
+MENU_CONTAINER_SELECTOR = ".artdeco-dropdown, .feed-shared-control-menu"
+# Class names that show the post menu has opened
+DROPDOWN_CLASSES = ["option-delete", "feed-shared-control-menu__content"]
+CONFIRM_BUTTON_SELECTOR = "button.feed-components-shared-decision-modal__confirm-button"
+
+# Runs the whole menu / delete / confirm sequence for one post inside the browser.
+# Each stage waits on a MutationObserver for the next element to render, and the
+# script reports 'ok', 'restricted', 'no_confirm', 'no_menu', 'no_dropdown' or 'stale'.
+DELETE_POST_JS = """
+const [post, menuSelectors, containerSelector, dropdownClasses, deleteSelectors, deleteText, confirmSelector, done] = arguments;
+const visible = el => { const r = el.getBoundingClientRect(); return r.width > 0 && r.height > 0; };
+const first = (scope, sels) => {
+    for (const sel of sels) {
+        for (const el of scope.querySelectorAll(sel)) {
+            if (visible(el)) return el;
+        }
+    }
+    return null;
+};
+const waitFor = (find, timeout) => new Promise(resolve => {
+    const found = find();
+    if (found) return resolve(found);
+    const observer = new MutationObserver(() => {
+        const el = find();
+        if (el) { observer.disconnect(); clearTimeout(timer); resolve(el); }
+    });
+    const timer = setTimeout(() => { observer.disconnect(); resolve(find()); }, timeout);
+    observer.observe(document.body, {childList: true, subtree: true, attributes: true});
+});
+const findDelete = scope => {
+    const del = first(scope, deleteSelectors);
+    if (del) return del;
+    for (const el of scope.querySelectorAll('button')) {
+        if (visible(el) && el.textContent.includes(deleteText)) return el;
+    }
+    return null;
+};
+(async () => {
+    if (!post.isConnected) return done('stale');
+    const menu = first(post, menuSelectors);
+    if (!menu) return done('no_menu');
+    menu.scrollIntoView({block: 'center'});
+    // Live collections under this post's menu, so closed menus elsewhere on the page don't count
+    const scope = menu.closest(containerSelector) || post;
+    const dropdowns = dropdownClasses.map(c => scope.getElementsByClassName(c));
+    menu.click();
+    if (!await waitFor(() => dropdowns.some(list => [...list].some(visible)), 3000)) return done('no_dropdown');
+    // The menu items can render a moment after the menu itself
+    const del = await waitFor(() => findDelete(scope) || findDelete(document), 1500);
+    if (!del) return done('restricted');
+    del.click();
+    const confirm = await waitFor(() => first(document, [confirmSelector]), 3000);
+    if (!confirm) return done('no_confirm');
+    confirm.click();
+    await waitFor(() => !first(document, [confirmSelector]), 3000);
+    done('ok');
+})().catch(e => done('error: ' + e.message));
+"""
+
+# Scans the post's text against the repost keyword table in the browser and returns the
+# first [indicator, repost_type] pair that matches, or null. Whitespace is collapsed since
+# textContent keeps the template's line breaks between inline elements.
+REPOST_TYPE_JS = """
+const text = arguments[0].textContent.replace(/\\s+/g, ' ').toLowerCase();
+for (const [indicator, repostType] of arguments[1]) {
+    if (text.includes(indicator)) return [indicator, repostType];
+}
+return null;
+"""
+
+# Remembers the latest rendered confirm button in the delete modal. The stepwise path
+# installs it before opening a post's menu and stops it when done, so it reads the
+# button with one call instead of polling a chain of XPath fallbacks.
+CONFIRM_BUTTON_OBSERVER_JS = """
+const selector = %s;
+const shown = el => el.getClientRects().length > 0 && !el.disabled;
+if (window.__linConfirmObserver) window.__linConfirmObserver.disconnect();
+window.__lastConfirmBtn = null;
+window.__linConfirmObserver = new MutationObserver(() => {
+    for (const button of document.querySelectorAll(selector)) {
+        if (shown(button)) { window.__lastConfirmBtn = button; return; }
+    }
+});
+window.__linConfirmObserver.observe(document.body, {childList: true, subtree: true});
+""" % json.dumps(CONFIRM_BUTTON_SELECTOR + ", [role='dialog'] button.artdeco-button--primary")
+
+# Disconnects the confirm button observer and drops whatever it was holding
+STOP_CONFIRM_OBSERVER_JS = """
+if (window.__linConfirmObserver) window.__linConfirmObserver.disconnect();
+window.__linConfirmObserver = null;
+window.__lastConfirmBtn = null;
+"""
+
+# Hands over the tracked confirm button once, if it is still on the page and rendered
+TAKE_CONFIRM_BUTTON_JS = """
+const button = window.__lastConfirmBtn;
+window.__lastConfirmBtn = null;
+return button && button.isConnected && button.getClientRects().length > 0 && !button.disabled ? button : null;
+"""
+
+# Post count from the main post class, read through a live collection kept on the window
+POST_COUNT_JS = """
+const posts = window.__linPosts || (window.__linPosts = document.getElementsByClassName('feed-shared-update-v2'));
+return posts.length;
+"""
+
+# Maps post elements to a stable key (data-urn / data-id on the element or inside it)
+POST_IDS_JS = """
+return arguments[0].map(el => {
+    const keyed = el.matches('[data-urn], [data-id]') ? el : el.querySelector('[data-urn], [data-id]');
+    return keyed ? (keyed.getAttribute('data-urn') || keyed.getAttribute('data-id')) : null;
+});
+"""
+
+# Drops a handled post's node so later queries and scroll measurements skip it
+REMOVE_NODE_JS = "try { arguments[0].remove(); } catch (e) {}"
+
+# Pause between deletions: starts short, doubles on throttling signs, eases back after a clean streak
+MIN_DELETE_DELAY = 0.5
+MAX_DELETE_DELAY = 5.0
+DELETE_DELAY_JITTER = 0.3
+EASE_OFF_STREAK = 10
+
+# Assets the script never needs: media, fonts, tracking beacons and embed scripts
+BLOCKED_URL_PATTERNS = [
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.mp4", "*.woff*",
+    "*linkedin.com/li/track*", "*platform.linkedin.com/*.js"
+]
+
+POST_SELECTORS = [
+    ".feed-shared-update-v2",
+    "[data-test-id*='post']",
+    ".feed-shared-update",
+    ".occludable-update"
+]
+
+# Returns [selector, elements] for the first selector in the chain that matches anything.
+# Plain single-class selectors go through getElementsByClassName, which is much
+# cheaper than querySelectorAll on the large activity DOM.
+FIRST_MATCHING_JS = """
+for (const sel of arguments[0]) {
+    const els = /^\\.[\\w-]+$/.test(sel)
+        ? document.getElementsByClassName(sel.slice(1))
+        : document.querySelectorAll(sel);
+    if (els.length) return [sel, Array.from(els)];
+}
+return [null, []];
+"""
+
+# Checks whether the menu opened from arguments[1] has rendered, looking only under
+# that menu's container so closed menus elsewhere on the page don't count
+DROPDOWN_OPEN_JS = """
+const [classes, menu, containerSelector] = arguments;
+const scope = menu.closest(containerSelector) || document;
+const visible = el => { const r = el.getBoundingClientRect(); return r.width > 0 && r.height > 0; };
+return classes.some(c => [...scope.getElementsByClassName(c)].some(visible));
+"""
+
 class LinkedInPostDeleter:
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, block_assets=True):
         """Initialize the LinkedIn Post Deleter with Chrome WebDriver."""
         self.driver = None
         self.headless = headless
+        self.block_assets = block_assets  # Skip images, fonts and beacons the script never uses
+        self.activity_url = None  # Page being processed, used to detect stray navigation
+        self._delay = MIN_DELETE_DELAY  # Current pause between deletions
+        self._success_streak = 0
+        self._waits = {}  # WebDriverWait instances by timeout, built on first use
         self.setup_driver()
     
     def setup_driver(self):
         """Set up Chrome WebDriver with appropriate options."""
+        # Imported here since the driver stack is most of this module's import time
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        
         chrome_options = Options()
         
         if self.headless:
@@ -42,22 +261,49 @@ class LinkedInPostDeleter:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
+        # Trim background work Chrome does that the script never needs
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-default-apps")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--renderer-process-limit=1")
+        prefs = {"profile.default_content_setting_values.notifications": 2}
+        
+        # Don't decode or lay out images; only the DOM matters
+        if self.block_assets:
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            prefs["profile.managed_default_content_settings.images"] = 2
+        chrome_options.add_experimental_option("prefs", prefs)
+        
         # User agent to avoid detection
         chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
         
         try:
             self.driver = webdriver.Chrome(options=chrome_options)
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            
+            # Block asset requests at the network layer so scrolling doesn't pull in media
+            if self.block_assets:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+                self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+            
             logger.info("Chrome WebDriver initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Chrome WebDriver: {e}")
             logger.info("Make sure you have ChromeDriver installed and in your PATH")
             sys.exit(1)
     
+    def wait(self, timeout):
+        """Return a cached WebDriverWait for the given timeout."""
+        from selenium.webdriver.support.ui import WebDriverWait
+        
+        if timeout not in self._waits:
+            self._waits[timeout] = WebDriverWait(self.driver, timeout)
+        return self._waits[timeout]
+    
     def wait_for_page_load(self, timeout=10):
         """Wait for the page to load completely."""
         try:
-            WebDriverWait(self.driver, timeout).until(
+            self.wait(timeout).until(
                 lambda driver: driver.execute_script("return document.readyState") == "complete"
             )
         except TimeoutException:
@@ -66,40 +312,26 @@ class LinkedInPostDeleter:
     def check_for_network_error(self):
         """Check if LinkedIn is showing a network error and handle it."""
         try:
-            # Look for common network error messages
-            error_selectors = [
-                "//*[contains(text(), 'Error with your network')]",
-                "//*[contains(text(), 'Something went wrong')]",
-                "//*[contains(text(), 'Please try again')]",
-                "//*[contains(text(), 'Network error')]",
-                "//*[contains(text(), 'Connection error')]",
-                ".feed-shared-error-message",
-                "[data-test-id*='error']",
-                ".error-message"
-            ]
+            # One query per selector type instead of one per error message
+            error_elements = (
+                self.driver.find_elements(By.CSS_SELECTOR, NETWORK_ERROR_CSS) +
+                self.driver.find_elements(By.XPATH, NETWORK_ERROR_XPATH)
+            )
             
-            for selector in error_selectors:
-                try:
-                    if selector.startswith("//"):
-                        error_element = self.driver.find_element(By.XPATH, selector)
-                    else:
-                        error_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    
-                    if error_element.is_displayed():
-                        logger.warning("Network error detected, waiting and retrying...")
-                        time.sleep(5)  # Wait 5 seconds
-                        
-                        # Try to refresh the page
-                        self.driver.refresh()
-                        time.sleep(3)
-                        
-                        # Wait for page to load
-                        self.wait_for_page_load()
-                        
-                        logger.info("Page refreshed after network error")
-                        return True
-                except NoSuchElementException:
-                    continue
+            if any(element.is_displayed() for element in error_elements):
+                logger.warning("Network error detected, waiting and retrying...")
+                time.sleep(5)  # Wait 5 seconds
+                
+                # Try to refresh the page
+                self.driver.refresh()
+                time.sleep(3)
+                
+                # Wait for page to load
+                self.wait_for_page_load()
+                
+                logger.info("Page refreshed after network error")
+                self.slow_down()
+                return True
             
             return False
             
@@ -107,19 +339,26 @@ class LinkedInPostDeleter:
             logger.warning(f"Error checking for network error: {e}")
             return False
     
-    def is_community_post(self, post_element, post_index):
-        """
-        Check if a post should be preserved (kept) or deleted.
-        Returns True if the post should be preserved (skipped), False if it should be deleted.
-        Currently configured to keep only the first post (index 0).
-        """
-        # Keep only the first post (index 0), delete all others
-        if post_index == 0:
-            logger.info("Preserving first post (index 0)")
-            return True
-        else:
-            logger.info(f"Deleting post at index {post_index}")
-            return False
+    def slow_down(self):
+        """Double the pause between deletions after a network error or failed delete."""
+        self._delay = min(self._delay * 2, MAX_DELETE_DELAY)
+        self._success_streak = 0
+        logger.info(f"Backing off, delay between deletions is now {self._delay:.1f}s")
+    
+    def pause_after_delete(self):
+        """Wait the current jittered delay, easing it back down after a streak of clean deletions."""
+        self._success_streak += 1
+        if self._success_streak >= EASE_OFF_STREAK:
+            self._delay = max(self._delay * 0.8, MIN_DELETE_DELAY)
+            self._success_streak = 0
+        time.sleep(self._delay + random.uniform(0, DELETE_DELAY_JITTER))
+    
+    def remove_post(self, post_element):
+        """Remove a handled post from the page so later queries and scrolls skip it."""
+        try:
+            self.driver.execute_script(REMOVE_NODE_JS, post_element)
+        except Exception:
+            pass  # A stale element means LinkedIn already removed the node
     
     def get_repost_type(self, post_element):
         """
@@ -127,77 +366,12 @@ class LinkedInPostDeleter:
         Returns: 'simple_repost' (4th), 'repost_with_thoughts' (5th), 'repost_of_repost' (3rd), or 'regular' (6th)
         """
         try:
-            post_text = post_element.text.lower()
-            
-            # Check for repost of someone else's repost with their thoughts (3rd button)
-            repost_of_repost_indicators = [
-                "reposted with thoughts",
-                "shared with thoughts", 
-                "reposted and added",
-                "shared and added",
-                "reposted with comment",
-                "shared with comment"
-            ]
-            
-            for indicator in repost_of_repost_indicators:
-                if indicator in post_text:
-                    logger.info(f"Found repost of repost with thoughts indicator: '{indicator}' - will use 3rd button")
-                    return 'repost_of_repost'
-            
-            # Check for simple repost (4th button)
-            simple_repost_indicators = [
-                "reposted this",
-                "shared this"
-            ]
-            
-            for indicator in simple_repost_indicators:
-                if indicator in post_text:
-                    logger.info(f"Found simple repost indicator: '{indicator}' - will use 4th button")
-                    return 'simple_repost'
-            
-            # Check for repost with my thoughts (5th button)
-            repost_with_thoughts_indicators = [
-                "reposted with my thoughts",
-                "shared with my thoughts",
-                "reposted and added my thoughts",
-                "shared and added my thoughts"
-            ]
-            
-            for indicator in repost_with_thoughts_indicators:
-                if indicator in post_text:
-                    logger.info(f"Found repost with my thoughts indicator: '{indicator}' - will use 5th button")
-                    return 'repost_with_thoughts'
-            
-            # Also check for specific repost elements
-            try:
-                repost_elements = post_element.find_elements(
-                    By.CSS_SELECTOR, 
-                    "[data-test-id*='repost'], [data-test-id*='share'], .feed-shared-actor-meta"
-                )
-                
-                for element in repost_elements:
-                    element_text = element.text.lower()
-                    
-                    # Check repost of repost first
-                    for indicator in repost_of_repost_indicators:
-                        if indicator in element_text:
-                            logger.info(f"Found repost of repost with thoughts in element: '{indicator}' - will use 3rd button")
-                            return 'repost_of_repost'
-                    
-                    # Check simple repost
-                    for indicator in simple_repost_indicators:
-                        if indicator in element_text:
-                            logger.info(f"Found simple repost in element: '{indicator}' - will use 4th button")
-                            return 'simple_repost'
-                    
-                    # Check repost with my thoughts
-                    for indicator in repost_with_thoughts_indicators:
-                        if indicator in element_text:
-                            logger.info(f"Found repost with my thoughts in element: '{indicator}' - will use 5th button")
-                            return 'repost_with_thoughts'
-                        
-            except NoSuchElementException:
-                pass
+            # Match in the browser so only the keyword comes back, not the post text
+            match = self.driver.execute_script(REPOST_TYPE_JS, post_element, REPOST_KEYWORDS)
+            if match:
+                indicator, repost_type = match
+                logger.info(f"Found {repost_type} indicator: '{indicator}' - will use {REPOST_BUTTONS[repost_type]} button")
+                return repost_type
                 
             return 'regular'  # Not a repost, use regular post logic
             
@@ -236,41 +410,86 @@ class LinkedInPostDeleter:
         except Exception as e:
             logger.error(f"Error navigating to recent activity: {e}")
     
+    def find_visible(self, root, selectors, text=None):
+        """
+        Find the first rendered element for a selector chain with a single WebDriver call.
+        Selectors are tried in order under root (or the whole page); if none match and text
+        is given, any rendered button containing that text is returned. Returns None if nothing matched.
+        """
+        return self.driver.execute_script(FIND_VISIBLE_JS, root, selectors, text)
+    
     def delete_post(self, post_element):
-        """Delete a single post by clicking the ... menu and selecting delete.
-        Returns: True if deleted successfully, False if failed, 'restricted' if no delete option available.
+        """Delete a single post by running the whole menu/delete/confirm sequence in the browser.
+        Falls back to delete_post_stepwise if the script itself cannot run.
+        Returns: True if deleted successfully, False if failed, 'restricted' if no delete option available,
+        'stale' if the post element is no longer on the page.
         """
         try:
-            # Find and click the "..." menu button with more specific selectors
-            menu_button = None
-            menu_selectors = [
-                "button[aria-label*='More actions']",
-                "button[aria-label*='More']", 
-                "button[data-test-id*='more']",
-                ".feed-shared-control-menu__trigger",
-                "button[class*='control-menu']",
-                ".feed-shared-control-menu button"
-            ]
-            
-            for selector in menu_selectors:
-                try:
-                    menu_button = post_element.find_element(By.CSS_SELECTOR, selector)
-                    if menu_button.is_displayed():
-                        logger.info(f"Found menu button using selector: {selector}")
-                        break
-                except NoSuchElementException:
-                    continue
+            status = self.driver.execute_async_script(
+                DELETE_POST_JS, post_element, MENU_SELECTORS, MENU_CONTAINER_SELECTOR, DROPDOWN_CLASSES,
+                DELETE_BUTTON_SELECTORS, "Delete", CONFIRM_BUTTON_SELECTOR
+            )
+        except StaleElementReferenceException:
+            status = 'stale'
+        except Exception as e:
+            logger.warning(f"In-browser delete failed: {e}, falling back to step-by-step delete")
+            return self.delete_post_stepwise(post_element)
+        
+        if status == 'ok':
+            logger.info("Post deleted successfully")
+            return True
+        if status == 'stale':
+            logger.warning("Post element went stale before it could be deleted")
+            return 'stale'
+        if status == 'no_confirm':
+            logger.warning("No confirmation dialog found, post may have been deleted already")
+            return True
+        if status == 'restricted':
+            logger.info("No delete option found in menu - this appears to be a restricted post")
+            # Close the menu by clicking elsewhere or pressing escape
+            try:
+                self.driver.execute_script("document.activeElement.blur();")
+            except:
+                pass
+            return 'restricted'
+        
+        # If the menu never opened, check whether we clicked on the post content instead
+        if status == 'no_dropdown' and self.activity_url and self.driver.current_url != self.activity_url:
+            logger.warning("Clicked on post content instead of menu button, navigating back...")
+            self.driver.back()
+            time.sleep(2)
+            self.wait_for_page_load()
+            return False  # Return False to retry this post
+        
+        logger.error(f"Failed to delete post: {status}")
+        return False
+    
+    def delete_post_stepwise(self, post_element):
+        """Delete a single post by clicking the ... menu and selecting delete, one WebDriver command per step.
+        Returns: True if deleted successfully, False if failed, 'restricted' if no delete option available,
+        'stale' if the post element is no longer on the page.
+        """
+        from selenium.webdriver.support import expected_conditions as EC
+        
+        try:
+            # Find the "..." menu button; the whole selector chain runs in one browser call
+            menu_button = self.find_visible(post_element, MENU_SELECTORS)
+            if menu_button:
+                logger.info("Found menu button")
             
             if not menu_button:
                 logger.error("Could not find menu button for post")
                 return False
             
+            # Start tracking the confirm button before the menu opens, clearing any earlier one
+            self.driver.execute_script(CONFIRM_BUTTON_OBSERVER_JS)
+            
             # Scroll to make sure the button is visible and centered
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", menu_button)
-            time.sleep(0.5)
-            
-            # Store the current URL to detect if we navigated away
-            current_url = self.driver.current_url
+            try:
+                self.wait(2).until(EC.element_to_be_clickable(menu_button))
+            except TimeoutException:
+                logger.warning("Menu button not clickable yet, attempting click anyway")
             
             # Try multiple clicking strategies
             try:
@@ -280,11 +499,21 @@ class LinkedInPostDeleter:
                 # If regular click fails, try JavaScript click
                 self.driver.execute_script("arguments[0].click();", menu_button)
             
-            time.sleep(1)
+            # Wait for the dropdown to appear (or give a stray click time to navigate)
+            dropdown_open = True
+            try:
+                self.wait(3).until(
+                    lambda driver: driver.execute_script(
+                        DROPDOWN_OPEN_JS, DROPDOWN_CLASSES, menu_button, MENU_CONTAINER_SELECTOR
+                    )
+                )
+                logger.info("Dropdown menu appeared")
+            except TimeoutException:
+                logger.warning("Dropdown menu didn't appear in time")
+                dropdown_open = False
             
-            # Check if we accidentally clicked on the post content instead of the menu button
-            new_url = self.driver.current_url
-            if new_url != current_url:
+            # If the menu never opened, check whether we clicked on the post content instead
+            if not dropdown_open and self.activity_url and self.driver.current_url != self.activity_url:
                 logger.warning("Clicked on post content instead of menu button, navigating back...")
                 self.driver.back()
                 time.sleep(2)
@@ -294,37 +523,19 @@ class LinkedInPostDeleter:
             # Determine the type of post to know which delete button to use
             repost_type = self.get_repost_type(post_element)
             
-            # Wait for the dropdown to appear and find delete button directly
+            # Find delete button directly in the dropdown
             logger.info("Looking for delete button in dropdown menu...")
             
-            # Wait for the dropdown to appear
+            # Try the specific selector from the JS script, then fall back to a text search;
+            # the menu items can render a moment after the menu itself
             try:
-                WebDriverWait(self.driver, 2).until(
-                    lambda driver: len(driver.find_elements(
-                        By.CSS_SELECTOR, 
-                        ".feed-shared-control-menu__content"
-                    )) > 0
+                delete_button = self.wait(2).until(
+                    lambda driver: self.find_visible(None, DELETE_BUTTON_SELECTORS, "Delete")
                 )
-                logger.info("Dropdown menu appeared")
             except TimeoutException:
-                logger.warning("Dropdown menu didn't appear in time")
-            
-            # Try to find delete button using the specific selector from the JS script
-            delete_button = None
-            try:
-                # First try the specific selector from the JS script
-                delete_button = self.driver.find_element(By.CSS_SELECTOR, ".option-delete .feed-shared-control-menu__headline")
-                logger.info("Found delete button using .option-delete .feed-shared-control-menu__headline")
-            except NoSuchElementException:
-                pass
-            
-            # Fallback to text-based search if specific selector fails
-            if not delete_button:
-                try:
-                    delete_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Delete') or contains(text(), 'Delete post') or contains(text(), 'Delete repost')]")
-                    logger.info("Found delete button using text search")
-                except NoSuchElementException:
-                    pass
+                delete_button = None
+            if delete_button:
+                logger.info("Found delete button in dropdown menu")
             
             # Check if delete button is not available (restricted post)
             if not delete_button:
@@ -345,46 +556,19 @@ class LinkedInPostDeleter:
                 self.driver.execute_script("arguments[0].click();", delete_button)
                 logger.info("Clicked delete button with JavaScript")
             
-            time.sleep(1)
-            
             # Confirm deletion if there's a confirmation dialog
             try:
                 logger.info("Looking for confirmation dialog...")
-                # Wait a bit for the confirmation dialog to appear
-                time.sleep(1)
                 
-                # Try the specific confirmation button selector from the JS script first
+                # The observer has already picked up the button if the modal rendered
                 try:
-                    confirm_button = WebDriverWait(self.driver, 3).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, "button.feed-components-shared-decision-modal__confirm-button.artdeco-button.artdeco-button--primary.artdeco-button--2"))
+                    confirm_button = self.wait(3).until(
+                        lambda driver: driver.execute_script(TAKE_CONFIRM_BUTTON_JS)
                     )
-                    logger.info("Found confirmation button using specific selector from JS script")
+                    logger.info("Found confirmation button")
                 except TimeoutException:
-                    logger.warning("Specific confirmation button not found, trying fallback...")
                     confirm_button = None
                 
-                # Fallback to other selectors if specific one fails
-                if not confirm_button:
-                    confirm_selectors = [
-                        "//button[contains(@class, 'artdeco-button--primary')]",
-                        "//button[contains(text(), 'Delete')]",
-                        "//button[contains(text(), 'Confirm')]", 
-                        "//button[contains(text(), 'Yes')]",
-                        "//button[contains(@class, 'confirm')]",
-                        "//div[@role='dialog']//button[contains(text(), 'Delete')]",
-                        "//div[contains(@class, 'modal')]//button[contains(text(), 'Delete')]"
-                    ]
-                    
-                    for selector in confirm_selectors:
-                        try:
-                            confirm_button = WebDriverWait(self.driver, 2).until(
-                                EC.element_to_be_clickable((By.XPATH, selector))
-                            )
-                            logger.info(f"Found confirmation button with selector: {selector}")
-                            break
-                        except TimeoutException:
-                            continue
-                
                 if confirm_button:
                     # Try to click the confirmation button
                     try:
@@ -394,7 +578,11 @@ class LinkedInPostDeleter:
                         self.driver.execute_script("arguments[0].click();", confirm_button)
                         logger.info("Clicked confirmation button with JavaScript")
                     
-                    time.sleep(1)
+                    # Wait for the modal to close instead of sleeping
+                    try:
+                        self.wait(3).until(EC.invisibility_of_element(confirm_button))
+                    except TimeoutException:
+                        logger.warning("Confirmation dialog still visible after confirming")
                     logger.info("Post deleted successfully")
                     return True
                 else:
@@ -407,9 +595,18 @@ class LinkedInPostDeleter:
                 logger.info("Post deleted successfully (no confirmation needed)")
                 return True
                 
+        except StaleElementReferenceException:
+            logger.warning("Post element went stale before it could be deleted")
+            return 'stale'
         except Exception as e:
             logger.error(f"Failed to delete post: {e}")
             return False
+        finally:
+            # Only the stepwise path needs the observer, so it doesn't outlive this post
+            try:
+                self.driver.execute_script(STOP_CONFIRM_OBSERVER_JS)
+            except Exception:
+                pass
     
     def initial_scroll_loading(self, scroll_rounds=5, scroll_delay=2):
         """Perform initial aggressive scrolling to load more posts before processing."""
@@ -418,17 +615,24 @@ class LinkedInPostDeleter:
         for i in range(scroll_rounds):
             logger.info(f"Initial scroll round {i+1}/{scroll_rounds}")
             
-            # Scroll to bottom
+            # Scroll to bottom, remembering how many posts were loaded before
+            post_count = self.driver.execute_script(POST_COUNT_JS)
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(scroll_delay)
             
-            # Check for network errors after scrolling
-            if self.check_for_network_error():
-                logger.info("Network error handled during initial scrolling...")
+            # Move on as soon as new posts render; scroll_delay is now only the upper bound
+            try:
+                self.wait(scroll_delay).until(
+                    lambda driver: driver.execute_script(POST_COUNT_JS) > post_count
+                )
+            except TimeoutException:
+                # Check for network errors before deciding the feed has run out
+                if self.check_for_network_error():
+                    logger.info("Network error handled during initial scrolling...")
+                    continue
+                logger.info(f"No new posts after scroll {i+1}, stopping initial scrolling")
+                break
             
-            # Check if we've loaded more content
-            current_height = self.driver.execute_script("return document.body.scrollHeight")
-            logger.info(f"Page height after scroll {i+1}: {current_height}")
+            logger.info(f"Posts loaded after scroll {i+1}: {self.driver.execute_script(POST_COUNT_JS)}")
         
         logger.info("Initial scrolling complete, starting post processing...")
     
@@ -438,6 +642,7 @@ class LinkedInPostDeleter:
         
         # Wait for posts to load
         self.wait_for_page_load()
+        self.activity_url = self.driver.current_url
         time.sleep(3)
         
         # Perform initial aggressive scrolling to load more posts
@@ -449,48 +654,64 @@ class LinkedInPostDeleter:
         processed_count = 0
         consecutive_failures = 0
         
+        # Posts already preserved/deleted/attempted, keyed by URN so they are recognised
+        # after a refresh brings them back
+        handled_ids = set()
+        preserved_id = None
+        
         while True:
-            # Find all post elements on current page
-            post_selectors = [
-                ".feed-shared-update-v2",
-                "[data-test-id*='post']",
-                ".feed-shared-update",
-                ".occludable-update"
-            ]
-            
-            posts = []
-            for selector in post_selectors:
-                try:
-                    posts = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if posts:
-                        logger.info(f"Found {len(posts)} posts using selector: {selector}")
-                        break
-                except NoSuchElementException:
-                    continue
+            # Find all post elements on current page with one call over the selector chain
+            selector, posts = self.driver.execute_script(FIRST_MATCHING_JS, POST_SELECTORS)
+            if posts:
+                logger.info(f"Found {len(posts)} posts using selector: {selector}")
             
             if not posts:
                 logger.warning("No posts found on the page")
                 break
             
-            # Process posts on current page
+            post_ids = self.driver.execute_script(POST_IDS_JS, posts)
+            
+            # Process posts on current page, skipping the ones already handled. A refresh
+            # leaves every handle in posts stale, so it ends the pass and posts are re-fetched.
+            refreshed = False
             for i, post in enumerate(posts):
+                post_id = post_ids[i]
+                if post_id is None:
+                    # Without a URN the post can't be recognised after a refresh, so it may be
+                    # the preserved one; keep it rather than risk deleting it
+                    if post.id not in handled_ids:
+                        handled_ids.add(post.id)
+                        if preserved_id is None:
+                            preserved_id = post.id
+                        logger.info("Keeping post without a stable id")
+                    continue
+                if post_id in handled_ids:
+                    continue
+                
                 if max_posts and processed_count >= max_posts:
                     logger.info(f"Reached maximum posts limit ({max_posts}), stopping processing")
                     return
                 
                 processed_count += 1
+                handled_ids.add(post_id)
                 
                 try:
                     logger.info(f"Processing post {processed_count} (page post {i+1}/{len(posts)})")
                     
-                    # Check for network errors before processing
+                    # Check for network errors before processing; after a refresh, re-fetch the posts
                     if self.check_for_network_error():
-                        logger.info("Network error handled, continuing with post processing...")
+                        logger.info("Network error handled, re-fetching posts...")
+                        handled_ids.discard(post_id)
+                        processed_count -= 1
+                        refreshed = True
+                        break
                     
-                    # Check if this post should be preserved (first post only)
-                    if self.is_community_post(post, i):
+                    # Preserve the first post; its URN stays in handled_ids on later passes
+                    if preserved_id is None:
+                        preserved_id = post_id
                         logger.info("Skipping post (first post - preserved)")
                         skipped_count += 1
+                        self.remove_post(post)
                         continue
                     
                     logger.info("Attempting to delete regular post...")
@@ -501,6 +722,8 @@ class LinkedInPostDeleter:
                     
                     for retry in range(max_retries):
                         result = self.delete_post(post)
+                        if result == 'stale':
+                            break
                         if result == True:
                             deleted_count += 1
                             logger.info(f"Successfully deleted post {processed_count}")
@@ -520,13 +743,23 @@ class LinkedInPostDeleter:
                             else:
                                 logger.warning(f"Failed to delete post {processed_count} after {max_retries} attempts")
                     
+                    # LinkedIn re-rendered the feed under us; this isn't a failure, so the post is
+                    # released and picked up again from a fresh fetch
+                    if result == 'stale':
+                        handled_ids.discard(post_id)
+                        processed_count -= 1
+                        refreshed = True
+                        break
+                    
                     if is_restricted:
                         # Skip this post and continue with the next one
+                        self.remove_post(post)
                         continue
                     
                     if not deleted:
                         consecutive_failures += 1
                         logger.warning(f"Consecutive failures: {consecutive_failures}")
+                        self.slow_down()
                         
                         # If we have too many consecutive failures, refresh the page
                         if consecutive_failures >= 5:
@@ -540,47 +773,62 @@ class LinkedInPostDeleter:
                             self.initial_scroll_loading(scroll_rounds=3, scroll_delay=2)  # Fewer rounds after refresh
                             
                             consecutive_failures = 0  # Reset counter
+                            refreshed = True
                             logger.info("Page refreshed and scrolled, continuing with fresh elements...")
-                            break  # Break out of current page processing to start fresh
+                            break
                         
                         # Skip this post and continue with the next one
                         continue
                     
-                    # Wait between deletions to avoid being rate limited
-                    time.sleep(2)  # Increased from 1 to 2 seconds
+                    # Deleted posts are gone from LinkedIn too; drop whatever is left of the node
+                    self.remove_post(post)
+                    
+                    # Wait between deletions to avoid being rate limited; the delay adapts to LinkedIn's responses
+                    self.pause_after_delete()
                     
                     # Check for network errors after deletion
                     if self.check_for_network_error():
-                        logger.info("Network error handled after deletion...")
+                        logger.info("Network error handled after deletion, re-fetching posts...")
+                        refreshed = True
+                        break
                     
                 except Exception as e:
                     logger.error(f"Error processing post {processed_count}: {e}")
                     # Check for network errors on exception
                     if self.check_for_network_error():
-                        logger.info("Network error handled after exception...")
+                        logger.info("Network error handled after exception, re-fetching posts...")
+                        refreshed = True
+                        break
                     continue
             
+            if refreshed:
+                continue
+            
             # Check if we've reached the limit
             if max_posts and processed_count >= max_posts:
                 logger.info(f"Reached maximum posts limit ({max_posts}), stopping processing")
                 break
             
-            # Scroll down to load more posts
+            # Scroll down to load more posts, reading the height in the same call
             logger.info("Scrolling down to load more posts...")
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(3)  # Wait for new posts to load
+            scrolled_height = self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight); return document.body.scrollHeight;")
+            
+            # Wait for new posts to grow the page; give up after 3 seconds
+            try:
+                self.wait(3).until(
+                    lambda driver: driver.execute_script("return document.body.scrollHeight") > scrolled_height
+                )
+                grew = True
+            except TimeoutException:
+                grew = False
             
             # Check for network errors after scrolling
             if self.check_for_network_error():
                 logger.info("Network error handled after scrolling...")
+                continue
             
             # Check if we're at the bottom of the page
-            current_height = self.driver.execute_script("return document.body.scrollHeight")
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            
-            if current_height == new_height:
+            if not grew:
                 logger.info("Reached end of page, no more posts to load")
                 break
         
@@ -658,4 +906,5 @@ def main():
     deleter.run(url, max_posts, initial_scroll_rounds)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     main()
@@ -7,29 +7,280 @@ Automatically removes likes/reactions from your LinkedIn posts and comments.
 import time
 import sys
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 import logging
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Like button markup variants, each list queried as one comma-joined selector
+POST_LIKE_SELECTORS = [
+    ".react-button__trigger.artdeco-button[aria-pressed='true']",
+    "button[data-control-name='like_toggle'][aria-pressed='true']",
+    ".feed-shared-social-action-bar__action-button[aria-pressed='true']"
+]
+COMMENT_LIKE_SELECTORS = [
+    ".comments-comment-social-bar__like-action-button[aria-pressed='true']",
+    ".comment-social-bar__like-button[aria-pressed='true']",
+    "button[data-control-name='comment_like_toggle'][aria-pressed='true']"
+]
+POST_LIKE_SELECTOR = ", ".join(POST_LIKE_SELECTORS)
+COMMENT_LIKE_SELECTOR = ", ".join(COMMENT_LIKE_SELECTORS)
+# Any post or comment on the page, used to spot LinkedIn's blank error state
+CONTENT_SELECTOR = ", ".join([
+    ".feed-shared-update-v2",
+    ".feed-shared-update",
+    ".comments-comments-list__comment-item",
+    ".comments-comment-item",
+    "[data-test-id*='post']",
+    "[data-test-id*='comment']"
+])
+SHOW_PREVIOUS_COMMENTS_SELECTOR = ".button.comments-comments-list__show-previous-button"
+SHOW_PREVIOUS_REPLIES_SELECTOR = "button.show-prev-replies"
+
+# Collects liked post buttons, liked comment buttons and the rendered 'show previous'
+# buttons of both kinds in one browser call. A MutationObserver bumps a DOM revision counter
+# when nodes are added or removed or a like button's aria-pressed flips (not on LinkedIn's
+# constant class/style churn), and the queries are reused while the revision and selectors are
+# unchanged. Whether a 'show previous' button is rendered is checked fresh on every call.
+REACTION_BUTTONS_JS = """
+if (window.__linDomRev === undefined) {
+    window.__linDomRev = 0;
+    new MutationObserver(() => { window.__linDomRev++; })
+        .observe(document, {childList: true, subtree: true, attributes: true, attributeFilter: ['aria-pressed']});
+}
+const key = window.__linDomRev + '|' + Array.from(arguments).join('|');
+let cache = window.__linButtonCache;
+if (!cache || cache.key !== key) {
+    const all = sel => Array.from(document.querySelectorAll(sel));
+    cache = window.__linButtonCache = {key, lists: Array.from(arguments, all)};
+}
+const [posts, comments, previousComments, previousReplies] = cache.lists;
+const rendered = els => els.filter(el => el.offsetParent !== null);
+return [posts, comments, rendered(previousComments), rendered(previousReplies)];
+"""
+
+# LinkedIn error banners, matched against the page's rendered text and by class
+NETWORK_ERROR_TEXTS = [
+    "Error with your network",
+    "Something went wrong",
+    "Please try again",
+    "Network error",
+    "Connection error",
+    "There was an issue",
+    "Try again"
+]
+NETWORK_ERROR_SELECTORS = [
+    ".feed-shared-error-message",
+    "[data-test-id*='error']",
+    ".error-message",
+    ".error-page",
+    ".error-container"
+]
+
+# Reads the rendered text once and checks the error markers in the browser. innerText
+# skips hidden nodes, and the class matches must be shown the way is_displayed() sees it:
+# a non-empty box that isn't hidden through visibility or opacity.
+NETWORK_ERROR_JS = """
+const [texts, selectors] = arguments;
+const rendered = document.body.innerText;
+if (texts.some(t => rendered.includes(t))) return true;
+const visible = el => {
+    const r = el.getBoundingClientRect();
+    if (r.width === 0 || r.height === 0) return false;
+    const style = getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.opacity !== '0';
+};
+return selectors.some(sel => Array.from(document.querySelectorAll(sel)).some(visible));
+"""
+
+# Comment count links and buttons that open a post's comment section
+COMMENT_COUNT_SELECTOR = ", ".join([
+    "button[data-control-name='comment_count']",
+    ".social-counts-comments__count",
+    ".social-counts__item--comments button",
+    ".feed-shared-social-action-bar__action-button[data-control-name='comment_count']"
+])
+
+# Clicks every rendered comment count link whose text has a number and mentions comments,
+# replies or 'show'. Buttons and links reading "Show ... comment" are picked up by text.
+# Returns the clicked elements' text.
+EXPAND_COMMENTS_JS = """
+const candidates = new Set(document.querySelectorAll(arguments[0]));
+for (const el of document.querySelectorAll('button, a')) {
+    if (el.textContent.includes('comment') && el.textContent.includes('Show')) candidates.add(el);
+}
+const expanded = [];
+for (const el of candidates) {
+    const text = el.textContent.trim();
+    if (el.offsetParent === null || !/\\d/.test(text) || !/comment|show|reply/i.test(text)) continue;
+    el.scrollIntoView({block: 'center'});
+    el.click();
+    expanded.push(text);
+}
+return expanded;
+"""
+
+# Rendered elements for a selector; offsetParent is null for anything display:none
+RENDERED_ELEMENTS_JS = """
+return Array.from(document.querySelectorAll(arguments[0])).filter(el => el.offsetParent !== null);
+"""
+
+# Clicks every rendered 'show previous comments/replies' button, then scrolls to the bottom
+# and reports the new page height, so each scroll round is a single browser call
+SCROLL_AND_EXPAND_JS = """
+const [previousCommentsSelector, previousRepliesSelector] = arguments;
+const clickVisible = sel => {
+    let clicked = 0;
+    for (const button of document.querySelectorAll(sel)) {
+        if (button.offsetParent === null) continue;
+        button.click();
+        clicked++;
+    }
+    return clicked;
+};
+const commentsLoaded = clickVisible(previousCommentsSelector);
+const repliesLoaded = clickVisible(previousRepliesSelector);
+window.scrollTo(0, document.body.scrollHeight);
+return {height: document.body.scrollHeight, commentsLoaded, repliesLoaded};
+"""
+
+# Verifies a like button is still attached and pressed, scrolls it into view and clicks it
+# in one call. Reports 'ok', 'stale', 'not_liked' or 'error: <message>'.
+UNLIKE_JS = """
+const button = arguments[0];
+if (!button.isConnected) return 'stale';
+if (button.getAttribute('aria-pressed') !== 'true') return 'not_liked';
+try {
+    button.scrollIntoView({block: 'center'});
+    button.click();
+    return 'ok';
+} catch (e) {
+    return 'error: ' + e.message;
+}
+"""
+
+# Unlike pacing: start fast, halve the rate when LinkedIn pushes back, restore after a clean streak
+UNLIKE_RATE = 5  # Unlikes per second
+UNLIKE_BURST = 10
+MIN_UNLIKE_RATE = 0.2
+RESTORE_STREAK = 20
+
+# Reports whether the page has gone arguments[0] ms without nodes being added or removed,
+# installing the observer that timestamps them on the first call for each document. Attribute
+# churn (hover states, timestamps, animations) is ignored so it can't hold off the quiet period.
+DOM_QUIET_JS = """
+if (window.__linLastMutation === undefined) {
+    window.__linLastMutation = Date.now();
+    new MutationObserver(() => { window.__linLastMutation = Date.now(); })
+        .observe(document, {childList: true, subtree: true});
+}
+return Date.now() - window.__linLastMutation >= arguments[0];
+"""
+
+# True once a reload has replaced the document that was flagged before Page.reload
+RELOAD_DONE_JS = "return !window.__linReloading && document.readyState === 'complete';"
+
+# Unlikes a list of buttons in one async call. The first arguments[2] clicks use up the
+# token bucket's saved burst, later ones wait arguments[1] ms each so the batch keeps the
+# current pace. Outcomes are recorded on window.__linBatch as they happen, tagged with the
+# batch id in arguments[3], so a failed call can be resumed. Returns one UNLIKE_JS-style
+# outcome per button.
+BATCH_UNLIKE_JS = """
+const [buttons, intervalMs, freeClicks, batchId, done] = arguments;
+const pause = ms => new Promise(resolve => setTimeout(resolve, ms));
+const batch = window.__linBatch = {id: batchId, outcomes: [], stopped: false};
+(async () => {
+    let clicks = 0;
+    for (const button of buttons) {
+        if (!button.isConnected) { batch.outcomes.push('stale'); continue; }
+        if (button.getAttribute('aria-pressed') !== 'true') { batch.outcomes.push('not_liked'); continue; }
+        if (clicks >= freeClicks) await pause(intervalMs);
+        if (batch.stopped) break;
+        try {
+            button.scrollIntoView({block: 'center'});
+            button.click();
+            clicks++;
+            batch.outcomes.push('ok');
+        } catch (e) {
+            batch.outcomes.push('error: ' + e.message);
+        }
+    }
+    done(batch.outcomes);
+})();
+"""
+
+# Stops the batch with id arguments[0] if it is still running and returns its outcomes so far
+BATCH_PROGRESS_JS = """
+const batch = window.__linBatch;
+if (!batch || batch.id !== arguments[0]) return [];
+batch.stopped = true;
+return batch.outcomes;
+"""
+
+class TokenBucket:
+    """Token bucket throttle: allows `burst` actions at once, refilled at `rate` per second."""
+
+    def __init__(self, rate: float, burst: int):
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        self._refill()
+        if self.tokens < 1:
+            time.sleep((1 - self.tokens) / self.rate)
+            self._refill()
+        self.tokens -= 1
+
+    def available(self) -> int:
+        """Whole tokens available right now, without taking any."""
+        self._refill()
+        return int(self.tokens)
+
+    def charge(self, count: int) -> None:
+        """Take `count` tokens for actions already paced elsewhere; the balance may go negative."""
+        self._refill()
+        self.tokens -= count
+
+    def decay(self, factor: float) -> None:
+        """Scale the refill rate down and drop any saved-up burst."""
+        self.rate = max(self.rate * factor, MIN_UNLIKE_RATE)
+        self.tokens = min(self.tokens, 1.0)
+
+    def restore(self) -> None:
+        self.rate = self.base_rate
+
 class LinkedInReactionsDeleter:
     def __init__(self, headless: bool = False):
         self.driver = None
         self.headless = headless
+        self._rate = TokenBucket(rate=UNLIKE_RATE, burst=UNLIKE_BURST)
+        self._success_streak = 0
+        self._batch_id = 0
         self.setup_driver()
     
     def setup_driver(self) -> None:
         chrome_options = Options()
         if self.headless:
-            chrome_options.add_argument("--headless")
+            chrome_options.add_argument("--headless=new")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        # Skip image downloads and decoding; only the DOM is needed to find like buttons
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
@@ -37,9 +288,11 @@ class LinkedInReactionsDeleter:
         try:
             self.driver = webdriver.Chrome(options=chrome_options)
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            # Lookups here only probe for existence; waiting is done explicitly in wait_for_page_load
+            self.driver.implicitly_wait(0)
             logger.info("Chrome WebDriver initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize Chrome WebDriver: {e}")
+            logger.error("Failed to initialize Chrome WebDriver: %s", e)
             logger.info("Make sure you have ChromeDriver installed and in your PATH")
             sys.exit(1)
     
@@ -51,275 +304,236 @@ class LinkedInReactionsDeleter:
         except TimeoutException:
             logger.warning("Page load timeout, continuing anyway...")
     
+    def wait_for_dom_settled(self, quiet_ms: int = 750, timeout: int = 10) -> None:
+        """Wait until the page has gone quiet_ms without DOM changes."""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda driver: driver.execute_script(DOM_QUIET_JS, quiet_ms)
+            )
+        except TimeoutException:
+            logger.warning("Page still changing after refresh, continuing anyway...")
+    
+    def refresh_page(self) -> None:
+        """Reload the page and wait for LinkedIn to finish rendering it."""
+        # Page.reload returns as soon as the reload starts, so flag the old document to
+        # tell it apart from the new one while waiting
+        self.driver.execute_script("window.__linReloading = true;")
+        self.driver.execute_cdp_cmd("Page.reload", {"ignoreCache": False})
+        try:
+            WebDriverWait(self.driver, 10).until(lambda driver: driver.execute_script(RELOAD_DONE_JS))
+        except TimeoutException:
+            logger.warning("Page load timeout, continuing anyway...")
+        self.wait_for_dom_settled()
+    
     def check_for_network_error(self) -> bool:
         try:
-            error_selectors = [
-                "//*[contains(text(), 'Error with your network')]",
-                "//*[contains(text(), 'Something went wrong')]",
-                "//*[contains(text(), 'Please try again')]",
-                "//*[contains(text(), 'Network error')]",
-                "//*[contains(text(), 'Connection error')]",
-                "//*[contains(text(), 'There was an issue')]",
-                "//*[contains(text(), 'Something went wrong')]",
-                "//*[contains(text(), 'Try again')]",
-                ".feed-shared-error-message",
-                "[data-test-id*='error']",
-                ".error-message",
-                ".error-page",
-                ".error-container"
-            ]
-            for selector in error_selectors:
-                try:
-                    if selector.startswith("//"):
-                        error_element = self.driver.find_element(By.XPATH, selector)
-                    else:
-                        error_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if error_element.is_displayed():
-                        logger.warning("LinkedIn error page detected, refreshing...")
-                        time.sleep(2)
-                        self.driver.refresh()
-                        time.sleep(5)
-                        self.wait_for_page_load()
-                        logger.info("Page refreshed after LinkedIn error")
-                        return True
-                except NoSuchElementException:
-                    continue
+            if self.driver.execute_script(NETWORK_ERROR_JS, NETWORK_ERROR_TEXTS, NETWORK_ERROR_SELECTORS):
+                logger.warning("LinkedIn error page detected, refreshing...")
+                time.sleep(2)
+                self.refresh_page()
+                logger.info("Page refreshed after LinkedIn error")
+                self._rate.decay(0.5)
+                self._success_streak = 0
+                return True
             return False
         except Exception as e:
-            logger.warning(f"Error checking for network error: {e}")
+            logger.warning("Error checking for network error: %s", e)
             return False
 
     def check_for_empty_page(self) -> bool:
         """Check if the page has no content (likely due to LinkedIn error)."""
         try:
-            # Check if we're on a page with no posts/comments
-            content_selectors = [
-                ".feed-shared-update-v2",
-                ".feed-shared-update", 
-                ".comments-comments-list__comment-item",
-                ".comments-comment-item",
-                "[data-test-id*='post']",
-                "[data-test-id*='comment']"
-            ]
-            
-            has_content = False
-            for selector in content_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        has_content = True
-                        break
-                except NoSuchElementException:
-                    continue
+            # Check if we're on a page with no posts/comments; querySelector stops at the first match
+            has_content = self.driver.execute_script(
+                "return document.querySelector(arguments[0]) !== null;", CONTENT_SELECTOR
+            )
             
             if not has_content:
                 logger.warning("No content found on page, likely LinkedIn error - refreshing...")
                 time.sleep(2)
-                self.driver.refresh()
-                time.sleep(5)
-                self.wait_for_page_load()
+                self.refresh_page()
                 logger.info("Page refreshed due to empty content")
                 return True
             
             return False
         except Exception as e:
-            logger.warning(f"Error checking for empty page: {e}")
+            logger.warning("Error checking for empty page: %s", e)
             return False
 
-    def unlike_post(self, like_button) -> bool:
-        """Unlike a post by clicking the like button.
-        Returns: True if unliked successfully, False if failed.
+    def find_reaction_buttons(self) -> list[list]:
+        """Fetch liked post/comment buttons and 'show previous' buttons in a single call.
+        Returns: [liked posts, liked comments, previous comment buttons, previous reply buttons].
+        """
+        return self.driver.execute_script(
+            REACTION_BUTTONS_JS, POST_LIKE_SELECTOR, COMMENT_LIKE_SELECTOR,
+            SHOW_PREVIOUS_COMMENTS_SELECTOR, SHOW_PREVIOUS_REPLIES_SELECTOR
+        )
+
+    def _throttle_feedback(self, succeeded: bool, consecutive_failures: int = 0) -> None:
+        """Slow the unlike rate after repeated failures and restore it after a clean streak."""
+        if succeeded:
+            self._success_streak += 1
+            if self._success_streak >= RESTORE_STREAK:
+                self._rate.restore()
+                self._success_streak = 0
+            return
+        self._success_streak = 0
+        if consecutive_failures > 3:
+            self._rate.decay(0.5)
+            logger.info("Backing off, unlike rate is now %.1f/s", self._rate.rate)
+
+    def _unlike_batch(self, reactions: list[tuple]) -> list[str]:
+        """Unlike a batch of (like_button, kind) pairs in one paced async script, charging
+        the rate bucket for each click. If the call fails, unliking resumes one button at a
+        time from where the script stopped.
+        Returns: one outcome per button: 'ok', 'stale', 'not_liked' or 'error: <message>'.
         """
+        interval_ms = 1000 / self._rate.rate
+        self._batch_id += 1
+        self.driver.set_script_timeout(len(reactions) * interval_ms / 1000 + 10)
         try:
-            # Verify it's actually liked (aria-pressed="true")
-            aria_pressed = like_button.get_attribute("aria-pressed")
-            if aria_pressed != "true":
-                logger.info("Post is not liked, skipping")
-                return False
-            
-            # Scroll to button and click
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", like_button)
-            time.sleep(0.3)
-            
-            try:
-                like_button.click()
-                logger.info("Successfully unliked post")
-                return True
-            except Exception as e:
-                logger.warning(f"Regular click failed: {e}, trying JavaScript click")
-                try:
-                    self.driver.execute_script("arguments[0].click();", like_button)
-                    logger.info("Successfully unliked post with JavaScript")
-                    return True
-                except Exception as e2:
-                    logger.error(f"JavaScript click also failed: {e2}")
-                    return False
-                    
+            outcomes = self.driver.execute_async_script(
+                BATCH_UNLIKE_JS, [button for button, _ in reactions], interval_ms,
+                self._rate.available(), self._batch_id
+            )
+            # The script paced its own clicks; keep the bucket in step with them
+            self._rate.charge(outcomes.count('ok'))
         except Exception as e:
-            logger.error(f"Failed to unlike post: {e}")
-            return False
+            # A stale handle or a timeout fails the whole call; stop the script and carry on
+            # one button at a time from the first one it didn't get to
+            logger.warning("Batch unlike failed (%s), unliking one at a time", e)
+            try:
+                outcomes = list(self.driver.execute_script(BATCH_PROGRESS_JS, self._batch_id))
+            except Exception:
+                outcomes = []
+            self._rate.charge(outcomes.count('ok'))
+            for button, kind in reactions[len(outcomes):]:
+                self._rate.acquire()
+                outcomes.append('ok' if self._unlike(button, kind) else 'failed')
+        return outcomes
 
-    def unlike_comment(self, like_button) -> bool:
-        """Unlike a comment by clicking the like button.
+    def _unlike(self, like_button, kind: str = "post") -> bool:
+        """Unlike a post or comment by clicking its like button.
         Returns: True if unliked successfully, False if failed.
         """
         try:
-            # Verify it's actually liked (aria-pressed="true")
-            aria_pressed = like_button.get_attribute("aria-pressed")
-            if aria_pressed != "true":
-                logger.info("Comment is not liked, skipping")
-                return False
-            
-            # Scroll to button and click
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", like_button)
-            time.sleep(0.3)
-            
-            try:
-                like_button.click()
-                logger.info("Successfully unliked comment")
+            # Check aria-pressed, scroll and click in a single browser call
+            result = self.driver.execute_script(UNLIKE_JS, like_button)
+            if result == 'ok':
+                logger.info("Successfully unliked %s", kind)
                 return True
-            except Exception as e:
-                logger.warning(f"Regular click failed: {e}, trying JavaScript click")
-                try:
-                    self.driver.execute_script("arguments[0].click();", like_button)
-                    logger.info("Successfully unliked comment with JavaScript")
-                    return True
-                except Exception as e2:
-                    logger.error(f"JavaScript click also failed: {e2}")
-                    return False
-                    
+            if result == 'not_liked':
+                logger.info("%s is not liked, skipping", kind.capitalize())
+                return False
+            if result == 'stale':
+                return False
+            logger.error("Failed to unlike %s: %s", kind, result)
+            return False
+        except StaleElementReferenceException:
+            # LinkedIn re-rendered the button; it is picked up again on the next pass
+            return False
         except Exception as e:
-            logger.error(f"Failed to unlike comment: {e}")
+            logger.error("Failed to unlike %s: %s", kind, e)
             return False
 
-    def load_more_comments(self) -> int:
-        """Load more comments by clicking 'Show previous comments' buttons.
+    def load_more_comments(self, load_buttons: list | None = None) -> int:
+        """Load more comments by clicking rendered 'Show previous comments' buttons.
         Returns: Number of buttons clicked.
         """
         try:
-            load_buttons = self.driver.find_elements(By.CSS_SELECTOR, ".button.comments-comments-list__show-previous-button")
+            if load_buttons is None:
+                load_buttons = self.driver.execute_script(RENDERED_ELEMENTS_JS, SHOW_PREVIOUS_COMMENTS_SELECTOR)
             clicked_count = 0
             
             for button in load_buttons:
                 try:
-                    if button.is_displayed():
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-                        time.sleep(0.2)
-                        button.click()
-                        clicked_count += 1
-                        logger.info("Clicked 'Show previous comments' button")
+                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
+                    time.sleep(0.2)
+                    button.click()
+                    clicked_count += 1
+                    logger.info("Clicked 'Show previous comments' button")
                 except Exception as e:
-                    logger.warning(f"Failed to click load more comments button: {e}")
+                    logger.warning("Failed to click load more comments button: %s", e)
                     continue
             
             return clicked_count
         except Exception as e:
-            logger.warning(f"Error loading more comments: {e}")
+            logger.warning("Error loading more comments: %s", e)
             return 0
 
-    def load_previous_replies(self) -> int:
-        """Load previous replies by clicking 'Show previous replies' buttons.
+    def load_previous_replies(self, load_buttons: list | None = None) -> int:
+        """Load previous replies by clicking rendered 'Show previous replies' buttons.
         Returns: Number of buttons clicked.
         """
         try:
-            load_buttons = self.driver.find_elements(By.CSS_SELECTOR, "button.show-prev-replies")
+            if load_buttons is None:
+                load_buttons = self.driver.execute_script(RENDERED_ELEMENTS_JS, SHOW_PREVIOUS_REPLIES_SELECTOR)
             clicked_count = 0
             
             for button in load_buttons:
                 try:
-                    if button.is_displayed():
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-                        time.sleep(0.2)
-                        button.click()
-                        clicked_count += 1
-                        logger.info("Clicked 'Show previous replies' button")
+                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
+                    time.sleep(0.2)
+                    button.click()
+                    clicked_count += 1
+                    logger.info("Clicked 'Show previous replies' button")
                 except Exception as e:
-                    logger.warning(f"Failed to click load previous replies button: {e}")
+                    logger.warning("Failed to click load previous replies button: %s", e)
                     continue
             
             return clicked_count
         except Exception as e:
-            logger.warning(f"Error loading previous replies: {e}")
+            logger.warning("Error loading previous replies: %s", e)
             return 0
 
+    def _scroll_and_expand(self) -> dict:
+        """Click the visible 'show previous' buttons and scroll to the bottom in one call.
+        Returns: dict with the page height and the number of comment and reply buttons clicked.
+        """
+        return self.driver.execute_script(
+            SCROLL_AND_EXPAND_JS, SHOW_PREVIOUS_COMMENTS_SELECTOR, SHOW_PREVIOUS_REPLIES_SELECTOR
+        )
+
     def expand_comment_sections(self) -> int:
         """Click on comment count links to expand comment sections.
         Returns: Number of comment sections expanded.
         """
         try:
-            # Look for comment count links/buttons
-            comment_link_selectors = [
-                "button[data-control-name='comment_count']",
-                ".social-counts-comments__count",
-                ".social-counts__item--comments button",
-                ".feed-shared-social-action-bar__action-button[data-control-name='comment_count']",
-                "//button[contains(., 'comment') and contains(., 'Show')]",
-                "//button[contains(., 'comment') and contains(text(), 'Show')]",
-                "//a[contains(., 'comment') and contains(text(), 'Show')]"
-            ]
-            
-            expanded_count = 0
-            
-            for selector in comment_link_selectors:
-                try:
-                    if selector.startswith("//"):
-                        elements = self.driver.find_elements(By.XPATH, selector)
-                    else:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    for element in elements:
-                        try:
-                            if element.is_displayed():
-                                # Check if it's a comment count link (contains numbers or "Show")
-                                text = element.text.lower()
-                                if any(keyword in text for keyword in ['comment', 'show', 'reply']) and any(char.isdigit() for char in text):
-                                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                                    time.sleep(0.3)
-                                    element.click()
-                                    expanded_count += 1
-                                    logger.info(f"Expanded comment section: {element.text}")
-                                    time.sleep(1)  # Wait for comments to load
-                        except Exception as e:
-                            logger.warning(f"Failed to click comment link: {e}")
-                            continue
-                            
-                except NoSuchElementException:
-                    continue
-            
-            return expanded_count
+            # Filter and click in the browser; only the clicked links' text comes back
+            expanded = self.driver.execute_script(EXPAND_COMMENTS_JS, COMMENT_COUNT_SELECTOR)
+            if logger.isEnabledFor(logging.INFO):
+                for text in expanded:
+                    logger.info("Expanded comment section: %s", text)
+            return len(expanded)
         except Exception as e:
-            logger.warning(f"Error expanding comment sections: {e}")
+            logger.warning("Error expanding comment sections: %s", e)
             return 0
 
     def initial_scroll_loading(self, scroll_rounds: int = 5, scroll_delay: int = 2) -> None:
         """Perform initial aggressive scrolling to load more content."""
-        logger.info(f"Performing initial scrolling to load more content ({scroll_rounds} rounds)...")
+        logger.info("Performing initial scrolling to load more content (%s rounds)...", scroll_rounds)
         
         for i in range(scroll_rounds):
-            logger.info(f"Initial scroll round {i+1}/{scroll_rounds}")
+            logger.info("Initial scroll round %s/%s", i+1, scroll_rounds)
             
-            # Scroll to bottom
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            # Open the loaded comment/reply threads and scroll to bottom in one call
+            result = self._scroll_and_expand()
+            comments_loaded = result["commentsLoaded"]
+            replies_loaded = result["repliesLoaded"]
             time.sleep(scroll_delay)
             
-            # Load more comments and replies
-            comments_loaded = self.load_more_comments()
-            replies_loaded = self.load_previous_replies()
-            
             # Expand comment sections to reveal liked comments
             comment_sections_expanded = self.expand_comment_sections()
             
             if comments_loaded > 0 or replies_loaded > 0 or comment_sections_expanded > 0:
-                logger.info(f"Loaded {comments_loaded} comment sections, {replies_loaded} reply sections, and expanded {comment_sections_expanded} comment sections")
+                logger.info("Loaded %s comment sections, %s reply sections, and expanded %s comment sections", comments_loaded, replies_loaded, comment_sections_expanded)
                 time.sleep(1)  # Wait for content to load
             
             # Check for network errors
             if self.check_for_network_error():
                 logger.info("Network error handled during initial scrolling...")
             
-            # Check if we've loaded more content
-            current_height = self.driver.execute_script("return document.body.scrollHeight")
-            logger.info(f"Page height after scroll {i+1}: {current_height}")
+            logger.info("Page height after scroll %s: %s", i+1, result['height'])
         
         logger.info("Initial scrolling complete, starting reactions processing...")
 
@@ -341,41 +555,12 @@ class LinkedInReactionsDeleter:
         refresh_interval = 50  # Refresh page every 50 successful unlikes
         
         while True:
-            # Find liked posts
-            post_like_selectors = [
-                ".react-button__trigger.artdeco-button[aria-pressed='true']",
-                "button[data-control-name='like_toggle'][aria-pressed='true']",
-                ".feed-shared-social-action-bar__action-button[aria-pressed='true']"
-            ]
-            
-            liked_posts = []
-            for selector in post_like_selectors:
-                try:
-                    posts = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if posts:
-                        liked_posts = posts
-                        logger.info(f"Found {len(liked_posts)} liked posts using selector: {selector}")
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            # Find liked comments
-            comment_like_selectors = [
-                ".comments-comment-social-bar__like-action-button[aria-pressed='true']",
-                ".comment-social-bar__like-button[aria-pressed='true']",
-                "button[data-control-name='comment_like_toggle'][aria-pressed='true']"
-            ]
-            
-            liked_comments = []
-            for selector in comment_like_selectors:
-                try:
-                    comments = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if comments:
-                        liked_comments = comments
-                        logger.info(f"Found {len(liked_comments)} liked comments using selector: {selector}")
-                        break
-                except NoSuchElementException:
-                    continue
+            # Find liked posts and comments with one joined query each, in a single call
+            liked_posts, liked_comments, _, _ = self.find_reaction_buttons()
+            if liked_posts:
+                logger.info("Found %s liked posts", len(liked_posts))
+            if liked_comments:
+                logger.info("Found %s liked comments", len(liked_comments))
             
             total_reactions = len(liked_posts) + len(liked_comments)
             
@@ -392,9 +577,10 @@ class LinkedInReactionsDeleter:
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
                 time.sleep(3)
                 
-                # Load more comments and replies
-                comments_loaded = self.load_more_comments()
-                replies_loaded = self.load_previous_replies()
+                # Load more comments and replies, fetching both button sets in one call
+                _, _, previous_comments, previous_replies = self.find_reaction_buttons()
+                comments_loaded = self.load_more_comments(previous_comments)
+                replies_loaded = self.load_previous_replies(previous_replies)
                 
                 # Expand comment sections to reveal liked comments
                 comment_sections_expanded = self.expand_comment_sections()
@@ -403,113 +589,66 @@ class LinkedInReactionsDeleter:
                     logger.info("No more content to load, reached end of page")
                     break
                 else:
-                    logger.info(f"Loaded {comments_loaded} comment sections, {replies_loaded} reply sections, and expanded {comment_sections_expanded} comment sections, continuing...")
+                    logger.info("Loaded %s comment sections, %s reply sections, and expanded %s comment sections, continuing...", comments_loaded, replies_loaded, comment_sections_expanded)
                     continue
             
-            # Process liked posts
-            for i, like_button in enumerate(liked_posts):
-                if max_reactions and processed_count >= max_reactions:
-                    logger.info(f"Reached maximum reactions limit ({max_reactions}), stopping processing")
-                    return
-                
+            # Check for network errors; a refresh leaves the fetched buttons stale
+            if self.check_for_network_error():
+                logger.info("Network error handled, continuing with reactions processing...")
+                continue
+            
+            # Unlike posts and comments in one paced batch, cut off at the reaction limit
+            # and at the next periodic refresh
+            reactions = [(button, "post") for button in liked_posts] + [(button, "comment") for button in liked_comments]
+            if max_reactions:
+                reactions = reactions[:max_reactions - processed_count]
+            unliked_before = unliked_posts + unliked_comments
+            reactions = reactions[:refresh_interval - unliked_before % refresh_interval]
+            
+            outcomes = self._unlike_batch(reactions) if reactions else []
+            for (_, kind), outcome in zip(reactions, outcomes):
                 processed_count += 1
-                
-                try:
-                    logger.info(f"Processing liked post {processed_count} (post {i+1}/{len(liked_posts)})")
-                    
-                    # Check for network errors
-                    if self.check_for_network_error():
-                        logger.info("Network error handled, continuing with reactions processing...")
-                    
-                    # Unlike the post
-                    if self.unlike_post(like_button):
+                if outcome == 'ok':
+                    if kind == "post":
                         unliked_posts += 1
-                        consecutive_failures = 0
-                        
-                        # Check if we need to refresh the page
-                        if (unliked_posts + unliked_comments) % refresh_interval == 0:
-                            logger.info(f"Refreshing page after {unliked_posts + unliked_comments} successful unlikes...")
-                            self.driver.refresh()
-                            time.sleep(5)
-                            self.wait_for_page_load()
-                            self.initial_scroll_loading(scroll_rounds=3, scroll_delay=2)
-                            logger.info("Page refreshed and scrolled, continuing with fresh content...")
-                            break
                     else:
-                        consecutive_failures += 1
-                        logger.warning(f"Failed to unlike post {processed_count}")
-                    
-                    # Wait between unlikes to avoid being rate limited
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    logger.error(f"Error processing liked post {processed_count}: {e}")
-                    consecutive_failures += 1
-                    continue
-            
-            # Process liked comments
-            for i, like_button in enumerate(liked_comments):
-                if max_reactions and processed_count >= max_reactions:
-                    logger.info(f"Reached maximum reactions limit ({max_reactions}), stopping processing")
-                    return
-                
-                processed_count += 1
-                
-                try:
-                    logger.info(f"Processing liked comment {processed_count} (comment {i+1}/{len(liked_comments)})")
-                    
-                    # Check for network errors
-                    if self.check_for_network_error():
-                        logger.info("Network error handled, continuing with reactions processing...")
-                    
-                    # Unlike the comment
-                    if self.unlike_comment(like_button):
                         unliked_comments += 1
-                        consecutive_failures = 0
-                        
-                        # Check if we need to refresh the page
-                        if (unliked_posts + unliked_comments) % refresh_interval == 0:
-                            logger.info(f"Refreshing page after {unliked_posts + unliked_comments} successful unlikes...")
-                            self.driver.refresh()
-                            time.sleep(5)
-                            self.wait_for_page_load()
-                            self.initial_scroll_loading(scroll_rounds=3, scroll_delay=2)
-                            logger.info("Page refreshed and scrolled, continuing with fresh content...")
-                            break
-                    else:
-                        consecutive_failures += 1
-                        logger.warning(f"Failed to unlike comment {processed_count}")
-                    
-                    # Wait between unlikes to avoid being rate limited
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    logger.error(f"Error processing liked comment {processed_count}: {e}")
+                    consecutive_failures = 0
+                    self._throttle_feedback(True)
+                    logger.info("Unliked %s %s", kind, processed_count)
+                else:
                     consecutive_failures += 1
-                    continue
+                    logger.warning("Failed to unlike %s %s: %s", kind, processed_count, outcome)
+                    self._throttle_feedback(False, consecutive_failures)
+            
+            # Check if we need to refresh the page
+            unliked_total = unliked_posts + unliked_comments
+            if unliked_total > unliked_before and unliked_total % refresh_interval == 0:
+                logger.info("Refreshing page after %s successful unlikes...", unliked_total)
+                self.refresh_page()
+                self.initial_scroll_loading(scroll_rounds=3, scroll_delay=2)
+                logger.info("Page refreshed and scrolled, continuing with fresh content...")
             
             # Check if we've reached the limit
             if max_reactions and processed_count >= max_reactions:
-                logger.info(f"Reached maximum reactions limit ({max_reactions}), stopping processing")
+                logger.info("Reached maximum reactions limit (%s), stopping processing", max_reactions)
                 break
             
             # If we have too many consecutive failures, refresh the page
             if consecutive_failures >= 10:
                 logger.info("Too many consecutive failures, refreshing page to clear stale elements...")
-                self.driver.refresh()
-                time.sleep(5)
-                self.wait_for_page_load()
+                self.refresh_page()
                 self.initial_scroll_loading(scroll_rounds=3, scroll_delay=2)
                 consecutive_failures = 0
                 logger.info("Page refreshed and scrolled, continuing with fresh elements...")
                 continue
         
-        logger.info(f"Processing complete. Unliked posts: {unliked_posts}, Unliked comments: {unliked_comments}")
+        logger.info("Processing complete. Unliked posts: %s, Unliked comments: %s", unliked_posts, unliked_comments)
 
     def run(self, url: str, max_reactions: int | None = None, initial_scroll_rounds: int = 5) -> None:
         """Main method to run the reactions deletion process."""
         try:
-            logger.info(f"Navigating to: {url}")
+            logger.info("Navigating to: %s", url)
             self.driver.get(url)
             
             # Wait for page to load
@@ -519,13 +658,13 @@ class LinkedInReactionsDeleter:
             
             # Check current URL and log it
             current_url = self.driver.current_url
-            logger.info(f"Current URL after navigation: {current_url}")
+            logger.info("Current URL after navigation: %s", current_url)
             
             # Check if we're on a login page
             if "login" in current_url.lower() or "auth" in current_url.lower():
                 logger.info("Detected login page. Please log in manually.")
             elif "recent-activity" not in current_url.lower():
-                logger.warning(f"URL doesn't contain 'recent-activity'. Current URL: {current_url}")
+                logger.warning("URL doesn't contain 'recent-activity'. Current URL: %s", current_url)
                 logger.info("Please navigate to your Recent activity page")
             
             # Give user time to log in and navigate if needed
@@ -533,13 +672,13 @@ class LinkedInReactionsDeleter:
             
             # Log final URL before processing
             final_url = self.driver.current_url
-            logger.info(f"Final URL before processing: {final_url}")
+            logger.info("Final URL before processing: %s", final_url)
             
             # Process reactions
             self.process_reactions(max_reactions, initial_scroll_rounds)
             
         except Exception as e:
-            logger.error(f"An error occurred: {e}")
+            logger.error("An error occurred: %s", e)
         finally:
             if self.driver:
                 self.driver.quit()